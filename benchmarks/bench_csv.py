@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# d-day.csv 읽기/쓰기: 기존 split(",") 방식 vs csvfile (csv 모듈) vs CsvStore (캐시, 바뀐 것만 저장)
+#
+# 실행: python benchmarks/bench_csv.py [줄 수]
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dday_core.csvfile import read_csv_events, write_csv_events
+from dday_core.event import Event
+from dday_core.storage import CsvStore
+
+NAMES = ["회의", "마감", "생일", "여행", "병원 예약", "시험", "결혼식", "이사", "점심, 친구"]
+
+
+def make_events(count, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(2020, 1, 1).toordinal()
+    return [Event(rng.choice(NAMES), datetime.date.fromordinal(start + rng.randrange(3650)))
+            for _ in range(count)]
+
+
+def legacy_read(path):
+    """기존 YearProgressApp.load_ddays"""
+    events = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                parts = line.split(",")
+                if len(parts) >= 4:
+                    name, year, month, day = parts[0], parts[1], parts[2], parts[3]
+                    try:
+                        events.append(Event(name, datetime.date(int(year), int(month), int(day))))
+                    except ValueError:
+                        pass
+    return events
+
+
+def legacy_write(path, events):
+    """기존 YearProgressApp.save_ddays"""
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            date_obj = event.date_obj
+            f.write(f"{event.name},{date_obj.year},{date_obj.month},{date_obj.day}\n")
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<24}: {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    events = make_events(count)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "d-day.csv")
+        print(f"일정 {count}개")
+        timed("split 쓰기", legacy_write, path, events)
+        timed("split 읽기", legacy_read, path)
+        timed("csv 쓰기", write_csv_events, path, events)
+        timed("csv 읽기", read_csv_events, path)
+
+        store = CsvStore(path)
+        loaded = timed("CsvStore.load", store.load)
+        timed("CsvStore.load (캐시)", store.load)
+        timed("sync (변경 없음)", store.sync, loaded)
+        loaded[0].name = "변경"
+        timed("sync (한 개 변경)", store.sync, loaded)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# 일정 하나당 메모리 사용량: dict 표현 vs Event (__slots__)
+#
+# 실행: python benchmarks/bench_event_memory.py [개수]
+
+import datetime
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dday_core.event import events_from_dicts
+
+NAMES = ["회의", "마감", "생일", "여행", "병원 예약", "시험", "결혼식", "이사"]
+
+
+def make_rows(count, seed=0):
+    """JSON 파일에서 읽은 것과 같은 dict 목록 생성"""
+    rng = random.Random(seed)
+    start = datetime.date(2020, 1, 1).toordinal()
+    rows = [
+        {'name': rng.choice(NAMES), 'date': datetime.date.fromordinal(start + rng.randrange(3650)).isoformat()}
+        for _ in range(count)
+    ]
+    # json.load 처럼 문자열을 각각 새로 만든다
+    return json.loads(json.dumps(rows, ensure_ascii=False))
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    text = json.dumps(make_rows(count), ensure_ascii=False)
+
+    dicts, dict_bytes = measure(lambda: json.loads(text))
+    events, event_bytes = measure(lambda: events_from_dicts(json.loads(text)))
+    assert [(e.name, e.date) for e in events] == [(d['name'], d['date']) for d in dicts]
+
+    print(f"events: {count}")
+    print(f"dict  : {dict_bytes / count:7.1f} bytes/event")
+    print(f"Event : {event_bytes / count:7.1f} bytes/event ({event_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
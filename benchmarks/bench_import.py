@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# 핵심 로직 import 시간 확인 (회귀 방지용)
+# - 새 파이썬 프로세스에서 모듈을 import 하여 걸린 시간을 재고,
+#   GUI 툴킷(flet / tkinter)이 함께 import 되지 않았는지 확인한다.
+# - 기준 시간을 넘거나 GUI 모듈이 import 되면 종료 코드 1
+#
+# 실행: python benchmarks/bench_import.py [반복 횟수]
+# 기준 시간(ms)은 DDAY_IMPORT_BUDGET_MS 로 바꿀 수 있다 (기본 50)
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (import 할 코드, 함께 import 되면 안 되는 모듈)
+CASES = [
+    ("import dday_core", ("flet", "tkinter", "sqlite3")),
+    ("import dday_core.dates, dday_core.event, dday_core.index", ("flet", "tkinter", "sqlite3")),
+    ("import dday_core.progress, dday_core.gradient, dday_core.weeks", ("flet", "tkinter", "sqlite3")),
+    ("import dday_core.storage, dday_core.writer", ("flet", "tkinter", "sqlite3")),
+    ("import flet_dday_app", ("flet", "tkinter", "pkg_resources")),
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000, ",".join(name for name in {forbidden!r} if name in sys.modules))
+"""
+
+
+def measure(code, forbidden):
+    """새 프로세스에서 import 시간(ms)과 함께 import 된 금지 모듈 목록"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code, forbidden=forbidden)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    elapsed, _, loaded = result.stdout.strip().splitlines()[-1].partition(" ")
+    return float(elapsed), [name for name in loaded.split(",") if name]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    budget = float(os.environ.get("DDAY_IMPORT_BUDGET_MS", "50"))
+    failed = False
+    for code, forbidden in CASES:
+        try:
+            runs = [measure(code, forbidden) for _ in range(repeat)]
+        except subprocess.CalledProcessError as e:
+            print(f"{code:<64} 실패\n{e.stderr}")
+            failed = True
+            continue
+        best = min(elapsed for elapsed, _ in runs)
+        loaded = runs[0][1]
+        status = "ok"
+        if best > budget:
+            status = f"느림 (기준 {budget:.0f} ms)"
+            failed = True
+        if loaded:
+            status = f"GUI/무거운 모듈 import: {', '.join(loaded)}"
+            failed = True
+        print(f"{code:<64} {best:7.2f} ms  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# parse_date 벤치마크: strptime 체인 vs 단일 패스 파서
+#
+# 실행: python benchmarks/bench_parse_date.py [개수]
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dday_core.dates import _parse_date_strptime, parse_date, parse_dates
+
+
+def make_inputs(count, fmt, seed=0):
+    rng = random.Random(seed)
+    return [
+        fmt.format(y=rng.randint(1990, 2100), m=rng.randint(1, 12), d=rng.randint(1, 28))
+        for _ in range(count)
+    ]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    cases = {
+        "YYYY-MM-DD": make_inputs(count, "{y:04d}-{m:02d}-{d:02d}"),
+        "YYYY.MM.DD": make_inputs(count, "{y:04d}.{m:02d}.{d:02d}"),
+        "YYYYMMDD": make_inputs(count, "{y:04d}{m:02d}{d:02d}"),
+        "M/D/YYYY": make_inputs(count, "{m}/{d}/{y:04d}"),
+    }
+
+    print(f"{'format':<12} {'strptime':>10} {'parse_date':>11} {'parse_dates':>12} {'speedup':>8}")
+    for name, inputs in cases.items():
+        expected = [_parse_date_strptime(s.strip()) for s in inputs]
+        assert parse_dates(inputs) == expected
+        assert [parse_date(s) for s in inputs] == expected
+
+        slow = min(timeit.repeat(lambda: [_parse_date_strptime(s.strip()) for s in inputs], number=1, repeat=3))
+        single = min(timeit.repeat(lambda: [parse_date(s) for s in inputs], number=1, repeat=3))
+        batch = min(timeit.repeat(lambda: parse_dates(inputs), number=1, repeat=3))
+        print(f"{name:<12} {slow * 1e3:>8.1f}ms {single * 1e3:>9.1f}ms {batch * 1e3:>10.1f}ms {slow / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# 연간 진행률 바: 1px 프레임 600개 vs GradientBar (캔버스 + PhotoImage 한 장)
+# 위젯 수, 생성 시간, 매초 갱신(진행률 변화 없음) 시간을 비교한다.
+#
+# 실행: python benchmarks/bench_progress_bar.py [갱신 횟수]
+# (화면이 있는 환경에서 실행해야 한다)
+
+import os
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from year_progression import GradientBar
+
+WIDTH = 600
+HEIGHT = 40
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def build_frames(root):
+    """기존 방식: 프레임 하나에 1px 프레임 600개"""
+    container = tk.Frame(root, bg='white', height=HEIGHT, width=WIDTH)
+    container.pack(pady=25)
+    container.pack_propagate(False)
+    frames = []
+    for i in range(WIDTH):
+        frame = tk.Frame(container, height=HEIGHT, width=1)
+        frame.pack(side=tk.LEFT)
+        frames.append(frame)
+    return container, frames
+
+
+def update_frames(frames, progress):
+    for i in range(WIDTH):
+        if i / WIDTH < progress / 100:
+            if progress < 30:
+                r = 255
+                g = int((progress / 30) * 255)
+                b = int((progress / 30) * 255)
+            else:
+                r = int(0x4C + (0xAF - 0x4C) * (i / WIDTH))
+                g = int(0xAF + (0x50 - 0xAF) * (i / WIDTH))
+                b = int(0x50 + (0x50 - 0x50) * (i / WIDTH))
+            frames[i].config(bg="#{:02x}{:02x}{:02x}".format(r, g, b))
+        else:
+            frames[i].config(bg='white')
+
+
+def measure(label, build, update, ticks):
+    root = tk.Tk()
+    root.withdraw()
+    base = count_widgets(root)
+
+    start = time.perf_counter()
+    widget = build(root)
+    root.update_idletasks()
+    build_time = time.perf_counter() - start
+    widgets = count_widgets(root) - base
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        update(widget, 79.5)
+        root.update_idletasks()
+    tick_time = (time.perf_counter() - start) / ticks
+
+    root.destroy()
+    print(f"{label:<12} 위젯 {widgets:>4}개  생성 {build_time * 1000:8.2f} ms  "
+          f"갱신 {tick_time * 1000:8.3f} ms/회")
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    measure("frames x600", lambda root: build_frames(root)[1], update_frames, ticks)
+
+    def build_bar(root):
+        bar = GradientBar(root, width=WIDTH, height=HEIGHT)
+        bar.pack(pady=25)
+        return bar
+
+    measure("GradientBar", build_bar, lambda bar, progress: bar.draw(progress), ticks)
+
+
+if __name__ == "__main__":
+    main()
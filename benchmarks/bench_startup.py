@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# flet 앱 시작 시간: 예전 pkg_resources 버전 확인 vs importlib.metadata vs 현재 시작 경로
+# 각 항목을 새 파이썬 프로세스에서 실행하여 가장 짧은 시간을 출력한다.
+#
+# 실행: python benchmarks/bench_startup.py [반복 횟수] [배포판 이름]
+# (flet 이 설치되지 않은 환경에서는 배포판 이름에 pip 등을 넘겨 버전 확인 비용만 비교)
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import time
+start = time.perf_counter()
+{code}
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def cases(dist):
+    return [
+        ("pkg_resources 버전 확인 (예전)",
+         f"import pkg_resources; pkg_resources.get_distribution({dist!r}).version"),
+        ("importlib.metadata 버전 확인",
+         f"from importlib.metadata import version; version({dist!r})"),
+        ("import flet_dday_app (현재)",
+         "import flet_dday_app"),
+        ("import flet_dday_app + flet",
+         "import flet_dday_app; flet_dday_app.ft.Text"),
+    ]
+
+
+def measure(code):
+    result = subprocess.run([sys.executable, "-c", PROBE.format(code=code)],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    dist = sys.argv[2] if len(sys.argv) > 2 else "flet"
+    for label, code in cases(dist):
+        runs = [measure(code) for _ in range(repeat)]
+        if None in runs:
+            print(f"{label:<34}: 실행할 수 없음 (모듈이 설치되어 있는지 확인)")
+            continue
+        print(f"{label:<34}: {min(runs):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
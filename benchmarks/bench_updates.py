@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# flet 사용자 동작별 화면 갱신 왕복 횟수
+# - 요청 : 핸들러 안에서 갱신을 요청한 횟수 (묶음 처리 전에는 모두 page.update() 왕복)
+# - 왕복 : 묶음 처리 후 실제로 page.update() 를 호출한 횟수
+# flet 이 설치된 경우에만 실행할 수 있다 (페이지는 가짜 객체 사용).
+#
+# 실행: python benchmarks/bench_updates.py
+
+import datetime
+import os
+import sys
+import tempfile
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from suite import StubPage, make_events
+
+
+def select_first_row(manager):
+    row = manager.events_table.rows[0]
+    row.selected = True
+    manager.handle_row_select(types.SimpleNamespace(control=row, data='true'))
+
+
+def add_event(manager):
+    manager.show_add_form(None)
+    manager.new_event_name.value = "새 일정"
+    manager.new_date_row.controls[0].value = (datetime.date.today() + datetime.timedelta(days=3)).isoformat()
+    manager.new_event_date_str = manager.new_date_row.controls[0]
+    manager.save_new_event(None)
+
+
+def add_invalid_event(manager):
+    manager.show_add_form(None)
+    manager.new_event_name.value = "새 일정"
+    manager.new_date_row.controls[0].value = "언젠가"
+    manager.new_event_date_str = manager.new_date_row.controls[0]
+    manager.save_new_event(None)
+    manager.cancel_add_form(None)
+
+
+def edit_event(manager):
+    select_first_row(manager)
+    manager.show_edit_form(None)
+    manager.edit_event_name.value = "수정된 일정"
+    manager.edit_event_date_str = manager.edit_date_row.controls[0]
+    manager.update_event(None)
+
+
+def delete_event(manager):
+    select_first_row(manager)
+    manager.open_delete_dialog(None)
+
+
+def change_sort(manager):
+    manager.sort_dropdown.value = "이름순"
+    manager.sort_and_populate(True)
+
+
+def toggle_past(manager):
+    manager.toggle_past_events(None)
+    manager.toggle_past_events(None)
+
+
+def toggle_year_progress(manager):
+    manager.toggle_year_progress()
+    manager.toggle_year_progress()
+
+
+# (이름, 동작) - 동작 안에서 여러 핸들러를 부르는 경우 핸들러마다 따로 센다
+ACTIONS = [
+    ("행 선택", select_first_row),
+    ("일정 추가", add_event),
+    ("잘못된 날짜로 추가", add_invalid_event),
+    ("일정 수정", edit_event),
+    ("일정 삭제", delete_event),
+    ("정렬 변경", change_sort),
+    ("지나간 일정 전환 x2", toggle_past),
+    ("연간 진행률 전환 x2", toggle_year_progress),
+]
+
+
+def main():
+    try:
+        import flet_dday_app
+        flet_dday_app.ft.Text
+    except ImportError:
+        print("flet 이 설치되어 있지 않아 실행할 수 없습니다")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        flet_dday_app.DATA_FILE = os.path.join(directory, "dday_data.json")
+        flet_dday_app.SAVE_DELAY = 3600
+        flet_dday_app.save_data(make_events(100))
+        manager = flet_dday_app.DDayManager(StubPage())
+        updates = manager.updates
+
+        print(f"{'동작':<20} {'요청':>6} {'왕복':>6}")
+        for label, action in ACTIONS:
+            requests, round_trips = updates.requests, updates.round_trips
+            action(manager)
+            print(f"{label:<20} {updates.requests - requests:>6} {updates.round_trips - round_trips:>6}")
+        manager.close_writer()
+        flet_dday_app.get_store().close()
+
+
+if __name__ == "__main__":
+    main()
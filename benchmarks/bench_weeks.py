@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# D-Day 관리자 주간 진행 바 상태 계산: timedelta 반복 vs 서수 계산 (week_state_matrix)
+#
+# 실행: python benchmarks/bench_weeks.py [일정 수]
+
+import datetime
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dday_core.weeks import week_state_matrix
+
+
+def legacy_colors(today, target_date):
+    """기존 create_weekly_progress_bar 의 주별 색 계산"""
+    start_date = today - timedelta(weeks=4)
+    end_date = today + timedelta(weeks=4)
+    if target_date < start_date:
+        if (start_date - target_date).days // 7 > 0:
+            start_date = target_date
+    elif target_date > end_date:
+        if (target_date - end_date).days // 7 > 0:
+            start_date = target_date - timedelta(weeks=8)
+
+    colors = []
+    for week in range(9):
+        current_date = start_date + timedelta(weeks=week)
+        contains_target = False
+        for day in range(7):
+            if current_date + timedelta(days=day) == target_date:
+                contains_target = True
+                break
+        contains_today = False
+        for day in range(7):
+            if current_date + timedelta(days=day) == today:
+                contains_today = True
+                break
+        if week == 4:
+            continue
+        if contains_target:
+            colors.append('red')
+        elif contains_today:
+            colors.append('blue')
+        elif current_date <= today:
+            colors.append('gray')
+        else:
+            colors.append('')
+    return colors
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(0)
+    today = datetime.date.today()
+    targets = [today + timedelta(days=rng.randrange(-400, 400)) for _ in range(count)]
+    ordinals = [target.toordinal() for target in targets]
+
+    start = time.perf_counter()
+    for target in targets:
+        legacy_colors(today, target)
+    legacy = time.perf_counter() - start
+
+    start = time.perf_counter()
+    week_state_matrix(ordinals, today.toordinal())
+    matrix = time.perf_counter() - start
+
+    print(f"일정 {count}개")
+    print(f"timedelta 반복    : {legacy * 1000:8.2f} ms")
+    print(f"week_state_matrix : {matrix * 1000:8.2f} ms  ({legacy / matrix:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+# 날짜 / D-Day / 표 / 저장 경로 벤치마크 모음
+# - 일정 10개, 1천 개, 10만 개, 100만 개의 합성 데이터로 각 항목을 측정하고
+#   결과를 JSON 으로 저장한다. --compare 로 이전 결과와 비교하면
+#   기준 배율(--threshold)보다 느려진 항목이 있을 때 종료 코드 1을 돌려준다.
+# - flet 표 항목은 flet 이 설치된 경우에만 측정한다 (페이지는 가짜 객체 사용).
+#
+# 실행 예:
+#   python benchmarks/suite.py --output bench.json
+#   python benchmarks/suite.py --sizes 10 1000 --compare bench.json
+
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from dday_core.dates import calculate_dday, parse_date
+from dday_core.event import Event
+from dday_core.index import EventIndex
+from dday_core.progress import ProgressEngine
+
+DEFAULT_SIZES = [10, 1000, 100000, 1000000]
+
+NAMES = ["회의", "마감", "생일", "여행", "병원 예약", "시험", "결혼식", "이사", "점심, 친구"]
+
+# parse_date 입력으로 쓰는 날짜 표기
+DATE_FORMATS = ["{y:04d}-{m:02d}-{d:02d}", "{y:04d}.{m:02d}.{d:02d}", "{y:04d}{m:02d}{d:02d}", "{m}/{d}/{y:04d}"]
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터
+
+def make_dates(count, seed=0):
+    """오늘 기준 앞뒤 5년 사이의 datetime.date 목록"""
+    rng = random.Random(seed)
+    today = datetime.date.today().toordinal()
+    return [datetime.date.fromordinal(today + rng.randrange(-1826, 1827)) for _ in range(count)]
+
+
+def make_date_strings(count, seed=0):
+    """여러 표기가 섞인 날짜 문자열 목록"""
+    rng = random.Random(seed)
+    return [rng.choice(DATE_FORMATS).format(y=d.year, m=d.month, d=d.day) for d in make_dates(count, seed)]
+
+
+def make_events(count, seed=0):
+    """Event 목록 (날짜 형식이 잘못된 일정 1% 포함)"""
+    rng = random.Random(seed)
+    events = []
+    for date_obj in make_dates(count, seed):
+        if rng.random() < 0.01:
+            events.append(Event(rng.choice(NAMES), "날짜 미정"))
+        else:
+            events.append(Event(rng.choice(NAMES), date_obj))
+    return events
+
+
+# ---------------------------------------------------------------------------
+# 가짜 화면 객체
+
+class StubPage:
+    """flet Page 대신 쓰는 객체 (update 호출 수만 셈)"""
+
+    def __init__(self):
+        self.controls = []
+        self.overlay = []
+        self.updates = 0
+        self.title = None
+        self.theme_mode = None
+        self.vertical_alignment = None
+        self.floating_action_button = None
+        self.snack_bar = None
+        self.on_close = None
+
+    def add(self, *controls):
+        self.controls.extend(controls)
+        self.updates += 1
+
+    def update(self, *controls):
+        self.updates += 1
+
+    def open(self, control):
+        control.open = True
+
+    def run_task(self, handler, *args):
+        # 비동기 작업은 실행하지 않음
+        handler(*args).close()
+        return None
+
+
+class StubWidget:
+    """tkinter 위젯 대신 쓰는 객체 (config / after 만 흉내)"""
+
+    def __init__(self):
+        self.options = {}
+        self._after = 0
+
+    def config(self, **options):
+        self.options.update(options)
+
+    def cget(self, name):
+        return self.options.get(name, '')
+
+    def after(self, delay, callback):
+        self._after += 1
+        return f"after#{self._after}"
+
+    def after_cancel(self, after_id):
+        pass
+
+
+class StubImage:
+    def put(self, data, to=None):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# 측정 항목: 준비 함수는 일정 수(와 임시 폴더)를 받아 측정할 함수를 돌려준다
+
+def case_parse_date(size):
+    inputs = make_date_strings(size)
+    return lambda: [parse_date(s) for s in inputs]
+
+
+def case_calculate_dday(size):
+    inputs = [d.isoformat() for d in make_dates(size)]
+    return lambda: [calculate_dday(s) for s in inputs]
+
+
+def case_event_index(size):
+    events = make_events(size)
+    return lambda: EventIndex(events)
+
+
+# 측정이 끝나면 닫아야 하는 flet 매니저 (쓰기 스레드와 종료 훅을 정리)
+_managers = []
+
+
+def _flet_manager(size, directory):
+    import flet_dday_app
+
+    path = os.path.join(directory, "dday_data.json")
+    flet_dday_app.DATA_FILE = path
+    flet_dday_app.SAVE_DELAY = 3600
+    flet_dday_app.save_data(make_events(size))
+    manager = flet_dday_app.DDayManager(StubPage())
+    _managers.append(manager)
+    return flet_dday_app, manager
+
+
+def close_flet():
+    """측정에 쓴 flet 매니저와 저장소 닫기 (임시 폴더를 지우기 전에 호출)"""
+    while _managers:
+        _managers.pop().close_writer()
+    flet_dday_app = sys.modules.get('flet_dday_app')
+    if flet_dday_app is not None and flet_dday_app._store is not None:
+        flet_dday_app._store.close()
+        flet_dday_app._store = None
+
+
+def case_sort_and_populate(size, directory):
+    _, manager = _flet_manager(size, directory)
+    modes = ['급한 순서', '이름순']
+
+    def run():
+        for mode in modes:
+            manager.sort_dropdown.value = mode
+            manager.sort_and_populate(True)
+    return run
+
+
+def case_populate_table(size, directory):
+    _, manager = _flet_manager(size, directory)
+
+    def run():
+        # 행 캐시를 비워 처음 표를 그릴 때의 비용을 잰다
+        manager.row_cache.clear()
+        manager.row_states.clear()
+        manager.events_table.rows = []
+        manager.populate_table()
+    return run
+
+
+def case_save_data(size, directory):
+    import flet_dday_app
+
+    flet_dday_app.DATA_FILE = os.path.join(directory, "dday_data.json")
+    events = make_events(size)
+    return lambda: flet_dday_app.save_data(events)
+
+
+def case_load_data(size, directory):
+    import flet_dday_app
+
+    flet_dday_app.DATA_FILE = os.path.join(directory, "dday_data.json")
+    flet_dday_app.save_data(make_events(size))
+
+    def run():
+        # 캐시가 아닌 파일 읽기를 재기 위해 저장소를 새로 연다
+        flet_dday_app._store = None
+        return flet_dday_app.load_data()
+    return run
+
+
+def _tk_app(size, directory):
+    import year_progression
+    from dday_core.storage import DEFAULT_DATA_FILE, open_store
+
+    # 앱과 같은 방식으로 기본 JSON 저장 파일을 연다 (날짜가 잘못된 일정도 함께 저장)
+    path = os.path.join(directory, DEFAULT_DATA_FILE)
+    open_store(path).sync(make_events(size))
+
+    app = year_progression.YearProgressApp.__new__(year_progression.YearProgressApp)
+    app.root = StubWidget()
+    for name in ('date_colored_label', 'year_label', 'progress_label', 'days_label', 'remaining_label'):
+        setattr(app, name, StubWidget())
+    bar = year_progression.GradientBar.__new__(year_progression.GradientBar)
+    bar.bar_width, bar.bar_height, bar.image, bar.progress, bar._drawn = 600, 40, StubImage(), 0.0, None
+    app.progress_bar = bar
+    app.store = open_store(path)
+    app.ddays = []
+    app.hidden_ddays = []
+    app.is_blinking = False
+    app.progress_engine = ProgressEngine(year_progression.TIMEZONE)
+    app._update_after_id = None
+    app._blink_after_id = None
+    return year_progression, app
+
+
+def case_load_ddays(size, directory):
+    year_progression, app = _tk_app(size, directory)
+    path = app.store.path
+
+    def run():
+        app.store = year_progression.open_store(path)
+        app.load_ddays()
+    return run
+
+
+def case_save_ddays(size, directory):
+    _, app = _tk_app(size, directory)
+    app.load_ddays()
+    events = app.ddays
+
+    def run():
+        # 매번 일정 하나를 바꿔 실제로 파일을 쓰게 한다
+        events[0].name = "변경" if events[0].name != "변경" else "회의"
+        app.save_ddays()
+    return run
+
+
+def case_update_progress(size, directory):
+    _, app = _tk_app(size, directory)
+    app.load_ddays()
+    return app.update_progress
+
+
+# (이름, 준비 함수, 임시 폴더 필요 여부, 필요한 모듈)
+CASES = [
+    ("parse_date", case_parse_date, False, None),
+    ("calculate_dday", case_calculate_dday, False, None),
+    ("EventIndex", case_event_index, False, None),
+    ("sort_and_populate", case_sort_and_populate, True, "flet"),
+    ("populate_table", case_populate_table, True, "flet"),
+    ("save_data", case_save_data, True, None),
+    ("load_data", case_load_data, True, None),
+    ("load_ddays", case_load_ddays, True, "tkinter"),
+    ("save_ddays", case_save_ddays, True, "tkinter"),
+    ("update_progress", case_update_progress, True, "tkinter"),
+]
+
+
+# ---------------------------------------------------------------------------
+
+def time_case(run, repeat):
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_suite(sizes, repeat, selected=None):
+    results = []
+    for name, prepare, needs_directory, requires in CASES:
+        if selected and name not in selected:
+            continue
+        if requires and importlib.util.find_spec(requires) is None:
+            print(f"{name:<18} 건너뜀 ({requires} 없음)")
+            results.append({'case': name, 'skipped': f"{requires} not installed"})
+            continue
+        for size in sizes:
+            with tempfile.TemporaryDirectory() as directory:
+                try:
+                    run = prepare(size, directory) if needs_directory else prepare(size)
+                    runs = time_case(run, repeat)
+                finally:
+                    close_flet()
+            best = min(runs)
+            results.append({
+                'case': name,
+                'size': size,
+                'best_s': best,
+                'mean_s': sum(runs) / len(runs),
+                'runs': runs,
+            })
+            print(f"{name:<18} {size:>8}  {best * 1000:10.3f} ms")
+    return results
+
+
+def compare(results, baseline_path, threshold):
+    """이전 결과와 비교해 threshold 배 이상 느려진 항목 목록"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    old = {(r['case'], r['size']): r['best_s'] for r in baseline.get('results', []) if 'best_s' in r}
+    regressions = []
+    print(f"\n{baseline_path} 와 비교 (기준 {threshold:.2f}x)")
+    for result in results:
+        key = (result['case'], result.get('size'))
+        if 'best_s' not in result or key not in old or old[key] <= 0:
+            continue
+        ratio = result['best_s'] / old[key]
+        mark = "  느려짐" if ratio > threshold else ""
+        print(f"{key[0]:<18} {key[1]:>8}  {ratio:6.2f}x{mark}")
+        if ratio > threshold:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="D-Day 벤치마크 모음")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="일정 수 목록")
+    parser.add_argument('--repeat', type=int, default=3, help="항목별 반복 횟수")
+    parser.add_argument('--cases', nargs='+', help="측정할 항목 이름 (기본: 전체)")
+    parser.add_argument('--output', help="결과 JSON 파일")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    parser.add_argument('--threshold', type=float, default=1.25, help="느려짐으로 볼 배율")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = os.path.abspath(args.compare) if args.compare else None
+
+    # 각 항목이 만든 파일이 임시 폴더에만 생기도록 작업 폴더 이동
+    os.chdir(tempfile.gettempdir())
+    results = run_suite(args.sizes, args.repeat, args.cases)
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+            'repeat': args.repeat,
+        },
+        'results': results,
+    }
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if baseline and compare(results, baseline, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_submodules
 
 
 block_cipher = None
 
+# flet, sqlite3 은 lazy_import 로 처음 사용할 때 import 하므로 PyInstaller 가 찾지 못함 → 직접 포함
+hiddenimports = ['pkg_resources.py2_warn', 'flet', 'sqlite3'] + collect_submodules('flet')
+
 
 a = Analysis(
     ['flet_dday_app.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['pkg_resources.py2_warn'],
+    hiddenimports=hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 째깍째깍째깍째깍 feat. 똥방구쟁이
+# - GUI 없이 사용할 수 있는 D-Day 핵심 로직
+# - flet / tkinter 를 import 하지 않으며, 아래 이름들은 처음 사용할 때
+#   해당 하위 모듈을 import 하므로 패키지 import 는 몇 ms 안에 끝난다.
+
+import importlib
+
+# 공개 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'CsvStore': 'storage',
+    'Event': 'event',
+    'EventIndex': 'index',
+    'EventStore': 'storage',
+    'JsonJournalStore': 'storage',
+    'PagedEvents': 'storage',
+    'ProgressEngine': 'progress',
+    'SqliteStore': 'storage',
+    'SortedView': 'index',
+    'WriteBehindWriter': 'writer',
+    'calculate_dday': 'dates',
+    'date_to_ordinal': 'dates',
+    'events_from_dicts': 'event',
+    'format_dday': 'dates',
+    'gradient_png_base64': 'gradient',
+    'gradient_tk_row': 'gradient',
+    'lazy_import': 'lazy',
+    'migrate_to_sqlite': 'storage',
+    'open_store': 'storage',
+    'parse_date': 'dates',
+    'parse_dates': 'dates',
+    'progress_bucket': 'gradient',
+    'span': 'tracing',
+    'traced': 'tracing',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
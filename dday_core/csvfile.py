@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# tkinter 앱의 d-day.csv (이름,연,월,일) 읽기/쓰기
+# - csv 모듈로 한 줄씩 읽고 쓰며, 쉼표나 따옴표가 들어간 이름은 따옴표로 감싼다.
+# - 파일은 UTF-8 로 저장한다. 예전 버전이 인코딩을 지정하지 않고 저장한 파일
+#   (Windows 에서는 cp949)도 읽을 수 있도록 UTF-8 로 읽지 못하면 cp949 로 다시 읽는다.
+# - 예전 버전은 이름을 따옴표 없이 저장했으므로, 필드가 4개보다 많으면 뒤의 3개를
+#   날짜로 보고 앞부분을 이름으로 합친다.
+# - 읽지 못한 줄은 건너뛰고 (줄 번호, 사유) 를 errors 목록에 남긴다.
+# - 변경이 없으면 다시 쓰지 않는 저장과 다른 프로그램과의 동시 쓰기 처리는
+#   storage.CsvStore 가 맡는다.
+
+import csv
+import datetime
+import os
+
+from .event import Event
+
+ENCODING = 'utf-8'
+# UTF-8 로 읽지 못할 때 시도하는 인코딩 (예전 Windows 버전의 기본 인코딩)
+FALLBACK_ENCODINGS = ('cp949',)
+
+
+def iter_csv_events(path, encoding=ENCODING, errors=None):
+    """d-day.csv 를 한 줄씩 읽어 Event 를 돌려주는 제너레이터
+
+    errors 에 목록을 넘기면 읽지 못한 줄의 (줄 번호, 사유) 를 추가한다.
+    """
+    # utf-8-sig: 메모장 등이 붙인 BOM 제거
+    if encoding.lower().replace('_', '-') in ('utf-8', 'utf8'):
+        encoding = 'utf-8-sig'
+    with open(path, 'r', encoding=encoding, newline='') as f:
+        reader = csv.reader(f)
+        for row in reader:
+            if not row or (len(row) == 1 and not row[0].strip()):
+                continue  # 빈 줄 무시
+            line_number = reader.line_num
+            if len(row) < 4:
+                if errors is not None:
+                    errors.append((line_number, f"필드가 부족합니다: {','.join(row)}"))
+                continue
+            if len(row) > 4:
+                # 따옴표 없이 저장된 쉼표 포함 이름
+                row = [','.join(row[:-3])] + row[-3:]
+            name, year, month, day = row
+            try:
+                date_obj = datetime.date(int(year), int(month), int(day))
+            except ValueError:
+                if errors is not None:
+                    errors.append((line_number, f"잘못된 날짜입니다: {year},{month},{day}"))
+                continue
+            yield Event(name, date_obj)
+
+
+def read_csv_events(path, errors=None):
+    """d-day.csv 를 Event 목록으로 읽음 (파일이 없으면 빈 목록)"""
+    if not os.path.exists(path):
+        return []
+    encodings = (ENCODING,) + FALLBACK_ENCODINGS
+    for index, encoding in enumerate(encodings):
+        row_errors = []
+        try:
+            events = list(iter_csv_events(path, encoding, row_errors))
+        except UnicodeDecodeError:
+            if index == len(encodings) - 1:
+                raise
+            continue
+        if errors is not None:
+            errors.extend(row_errors)
+        return events
+
+
+def iter_csv_rows(events):
+    """Event 를 (이름, 연, 월, 일) 행으로 변환, 날짜 형식이 잘못된 일정은 건너뜀"""
+    for event in events:
+        date_obj = event.date_obj
+        if date_obj is not None:
+            yield (event.name, date_obj.year, date_obj.month, date_obj.day)
+
+
+def write_csv_rows(path, rows):
+    """(이름, 연, 월, 일) 행들을 d-day.csv 형식으로 저장 (임시 파일에 쓴 뒤 교체)"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding=ENCODING, newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerows(rows)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def write_csv_events(path, events):
+    """Event 목록을 d-day.csv 형식으로 저장"""
+    write_csv_rows(path, iter_csv_rows(events))
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 날짜 문자열 파싱 엔진
+# - parse_date: 지원하는 여러 형식을 YYYY-MM-DD 문자열로 정규화
+#   (마지막으로 맞은 형식을 기억해 먼저 시도하므로 같은 형식이 이어지면 빠름)
+# - parse_dates: 대량 입력용 배치 API (같은 공용 파서로 한 번에 처리)
+# - date_to_ordinal / calculate_dday: 저장된 YYYY-MM-DD 문자열의 서수 변환과 D-Day 계산
+#
+# strptime 은 호출마다 정규식 매칭과 로캘 처리를 거치기 때문에 느리다.
+# 여기서는 각 형식을 문자열 슬라이싱과 int 변환만으로 한 번에 해석하고,
+# 빠른 경로가 확신할 수 없는 입력(공백이 섞인 일자, 1000년 미만 등)만
+# 기존 strptime 체인(_parse_date_strptime)으로 넘겨 결과를 똑같이 유지한다.
+
+import datetime
+
+# 기존 parse_date 가 순서대로 시도하던 일반 형식들
+_FALLBACK_FORMATS = ["%Y/%m/%d", "%d-%m-%Y", "%d.%m.%Y", "%m/%d/%Y"]
+
+
+def _parse_date_strptime(date_input):
+    """strptime 기반의 기존 파서 (빠른 경로가 처리하지 못한 입력 및 벤치마크 기준용)"""
+    # 이미 YYYY-MM-DD 형식이면 그대로 반환
+    if len(date_input) == 10 and date_input[4] == '-' and date_input[7] == '-':
+        try:
+            datetime.datetime.strptime(date_input, "%Y-%m-%d")
+            return date_input
+        except ValueError:
+            pass
+
+    # YYYY.MM.DD 형식
+    if len(date_input) == 10 and date_input[4] == '.' and date_input[7] == '.':
+        try:
+            date_obj = datetime.datetime.strptime(date_input, "%Y.%m.%d")
+            return date_obj.strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
+    # YYYYMMDD 형식 (숫자 8자리)
+    if len(date_input) == 8 and date_input.isdigit():
+        try:
+            date_obj = datetime.datetime.strptime(date_input, "%Y%m%d")
+            return date_obj.strftime("%Y-%m-%d")
+        except ValueError:
+            pass
+
+    # 다른 일반적인 날짜 형식도 시도
+    for fmt in _FALLBACK_FORMATS:
+        try:
+            date_obj = datetime.datetime.strptime(date_input, fmt)
+            return date_obj.strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+
+    # 파싱 실패 시 None 반환
+    return None
+
+
+def _is_digits(s):
+    """ASCII 숫자로만 이루어졌는지 확인 (str.isdigit 은 유니코드 숫자도 허용하므로)"""
+    return s.isascii() and s.isdigit()
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year):
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _ymd(year, month, day):
+    """(연, 월, 일) 문자열을 검증하여 YYYY-MM-DD 로 반환, 확신할 수 없으면 None"""
+    y = int(year)
+    # strftime("%Y") 는 1000년 미만을 0 채움 없이 출력하므로 기존 경로에 맡긴다
+    if y < 1000:
+        return None
+    m = int(month)
+    d = int(day)
+    if not 1 <= m <= 12 or d < 1:
+        return None
+    if d > _DAYS_IN_MONTH[m] and not (m == 2 and d == 29 and _is_leap(y)):
+        return None
+    return f"{y}-{m:02d}-{d:02d}"
+
+
+def _fixed(sep):
+    """YYYY<sep>MM<sep>DD 고정 폭 형식"""
+    def match(s):
+        if len(s) != 10 or s[4] != sep or s[7] != sep or not s.isascii():
+            return None
+        iso = s if sep == '-' else s.replace(sep, '-')
+        if not (iso[0:4] + iso[5:7] + iso[8:10]).isdigit() or iso[0] == '0':
+            return None
+        try:
+            datetime.date.fromisoformat(iso)
+        except ValueError:
+            return None
+        return iso
+    return match
+
+
+def _compact(s):
+    """YYYYMMDD 형식"""
+    if len(s) != 8 or not _is_digits(s):
+        return None
+    return _ymd(s[0:4], s[4:6], s[6:8])
+
+
+def _split(sep, order):
+    """구분자로 나뉜 가변 폭 형식 (월/일은 1~2자리, 연도는 4자리)"""
+    def match(s):
+        parts = s.split(sep)
+        if len(parts) != 3:
+            return None
+        fields = dict(zip(order, parts))
+        year, month, day = fields['Y'], fields['m'], fields['d']
+        if len(year) != 4 or not 1 <= len(month) <= 2 or not 1 <= len(day) <= 2:
+            return None
+        if not (_is_digits(year) and _is_digits(month) and _is_digits(day)):
+            return None
+        return _ymd(year, month, day)
+    return match
+
+
+# 기존 parse_date 의 시도 순서와 같은 순서로 나열한 형식들.
+# 각 형식이 받아들이는 문자열 모양은 서로 겹치지 않으므로 어떤 순서로
+# 시도하든 결과가 같다. 덕분에 마지막으로 맞은 형식을 먼저 시도해도 된다.
+_LAYOUTS = [
+    _fixed('-'),                # YYYY-MM-DD
+    _fixed('.'),                # YYYY.MM.DD
+    _compact,                   # YYYYMMDD
+    _split('/', 'Ymd'),         # YYYY/M/D
+    _split('-', 'dmY'),         # D-M-YYYY
+    _split('.', 'dmY'),         # D.M.YYYY
+    _split('/', 'mdY'),         # M/D/YYYY
+]
+
+
+class DateParser:
+    """마지막으로 맞은 형식을 기억하는 날짜 파서
+
+    같은 형식의 입력이 이어지면 첫 시도에서 바로 맞으므로 나머지 형식은
+    검사하지 않는다. 결과는 항상 parse_date 와 같다.
+    """
+
+    def __init__(self):
+        self._last = 0
+
+    def parse(self, date_input):
+        """날짜 문자열을 YYYY-MM-DD 형식으로 반환, 실패 시 None"""
+        date_input = date_input.strip()
+
+        last = self._last
+        result = _LAYOUTS[last](date_input)
+        if result is not None:
+            return result
+
+        for index, layout in enumerate(_LAYOUTS):
+            if index == last:
+                continue
+            result = layout(date_input)
+            if result is not None:
+                self._last = index
+                return result
+
+        # 빠른 경로로 확신할 수 없는 입력은 기존 파서로 처리
+        return _parse_date_strptime(date_input)
+
+
+_default_parser = DateParser()
+
+
+def parse_date(date_input):
+    """다양한 형식의 날짜 문자열을 파싱하여 YYYY-MM-DD 형식으로 반환"""
+    return _default_parser.parse(date_input)
+
+
+def parse_dates(date_inputs):
+    """여러 날짜 문자열을 한 번에 파싱하여 리스트로 반환 (실패한 항목은 None)
+
+    공용 파서의 parse 메서드를 한 번만 찾아 반복하므로 항목마다 parse_date 를
+    부르는 것보다 함수 호출이 한 단계 적다.
+    """
+    parse = _default_parser.parse
+    return [parse(date_input) for date_input in date_inputs]
+
+
+def date_to_ordinal(date_str):
+    """YYYY-MM-DD 문자열을 날짜 서수(date.toordinal)로 변환, 실패 시 None
+
+    strptime("%Y-%m-%d") 와 같은 입력을 받아들인다.
+    """
+    if len(date_str) == 10 and date_str.isascii() and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return datetime.date.fromisoformat(date_str).toordinal()
+        except ValueError:
+            pass
+    try:
+        return datetime.datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+    except ValueError:
+        return None
+
+
+def format_dday(days):
+    """남은 일수를 D-Day 문자열로 변환"""
+    if days == 0:
+        return "D-Day"
+    elif days > 0:
+        return f"D-{days}"
+    else:
+        return f"D+{abs(days)}"
+
+
+def calculate_dday(date_str):
+    """Calculates D-Day string from a date string (YYYY-MM-DD)."""
+    ordinal = date_to_ordinal(date_str)
+    if ordinal is None:
+        return "날짜 오류" # Error with date format
+    return format_dday(ordinal - datetime.date.today().toordinal())
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# D-Day 일정 모델 (tkinter / flet 공용)
+# - 날짜는 정수 서수(date.toordinal)로만 보관하고, 문자열은 필요할 때 만든다.
+# - __slots__ 와 이름 intern 으로 일정 수십만 개를 메모리에 올려도 가볍게 유지한다.
+# - 각 일정은 고유한 id 를 가지며, 저장 파일에 함께 기록되어 다시 불러와도 유지된다.
+
+import datetime
+import sys
+import threading
+
+from .dates import date_to_ordinal
+
+# 마지막으로 발급한 일정 id (UI 스레드와 쓰기 스레드가 함께 발급하므로 잠금 안에서만 변경)
+_last_id = 0
+_id_lock = threading.Lock()
+
+
+def _allocate_id(event_id=None):
+    """새 id 를 발급하거나, 주어진 id 를 사용하면서 이후 발급 번호를 그 뒤로 맞춘다"""
+    global _last_id
+    with _id_lock:
+        if event_id is None:
+            _last_id += 1
+            return _last_id
+        if event_id > _last_id:
+            _last_id = event_id
+        return event_id
+
+
+class Event:
+    """D-Day 일정 하나
+
+    date 에는 YYYY-MM-DD 문자열이나 datetime.date 를 넣을 수 있다.
+    날짜 형식이 잘못된 문자열은 ordinal 이 None 이 되고 원문을 그대로 보관한다.
+    """
+
+    __slots__ = ('id', '_name', 'ordinal', '_raw_date')
+
+    def __init__(self, name, date, id=None):
+        self.id = _allocate_id(id)
+        self.name = name
+        self._raw_date = None
+        self.ordinal = None
+        self.date = date
+
+    @property
+    def name(self):
+        """일정 이름"""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = sys.intern(value)
+
+    @property
+    def date(self):
+        """YYYY-MM-DD 형식의 날짜 문자열"""
+        if self._raw_date is not None:
+            return self._raw_date
+        return datetime.date.fromordinal(self.ordinal).isoformat()
+
+    @date.setter
+    def date(self, value):
+        if isinstance(value, datetime.date):
+            self.ordinal = value.toordinal()
+            self._raw_date = None
+            return
+        if self.ordinal is not None and self._raw_date is None and value == self.date:
+            return
+        ordinal = date_to_ordinal(value)
+        self.ordinal = ordinal
+        # 서수에서 다시 만든 문자열과 다른 경우(날짜 오류, 비표준 표기)만 원문 보관
+        if ordinal is not None and datetime.date.fromordinal(ordinal).isoformat() == value:
+            self._raw_date = None
+        else:
+            self._raw_date = sys.intern(value)
+
+    @property
+    def date_obj(self):
+        """datetime.date 객체, 날짜 형식이 잘못된 경우 None"""
+        if self.ordinal is None:
+            return None
+        return datetime.date.fromordinal(self.ordinal)
+
+    def days_left(self, today_ordinal):
+        """오늘부터 남은 일수, 날짜 형식이 잘못된 경우 None"""
+        ordinal = self.ordinal
+        if ordinal is None:
+            return None
+        return ordinal - today_ordinal
+
+    def copy(self):
+        """같은 id, 이름, 날짜를 가진 사본 (날짜를 다시 해석하지 않음)"""
+        event = Event.__new__(Event)
+        event.id = self.id
+        event._name = self._name
+        event.ordinal = self.ordinal
+        event._raw_date = self._raw_date
+        return event
+
+    def to_dict(self):
+        """JSON 저장용 딕셔너리로 변환"""
+        return {'id': self.id, 'name': self._name, 'date': self.date}
+
+    @classmethod
+    def from_dict(cls, data):
+        """JSON 에서 읽은 딕셔너리로부터 생성"""
+        return cls(data.get('name', ''), data.get('date', ''), data.get('id'))
+
+    def __repr__(self):
+        return f"Event({self._name!r}, {self.date!r}, id={self.id})"
+
+
+def events_from_dicts(rows):
+    """저장된 딕셔너리 목록을 Event 목록으로 변환
+
+    파일에 기록된 id 를 먼저 예약해 새로 발급하는 id 와 겹치지 않게 하고,
+    id 가 없거나 중복된 항목에는 새 id 를 발급한다.
+    """
+    ids = [row.get('id') for row in rows]
+    valid = [event_id for event_id in ids if type(event_id) is int and event_id > 0]
+    if valid:
+        _allocate_id(max(valid))
+
+    seen = set()
+    events = []
+    for row, event_id in zip(rows, ids):
+        if type(event_id) is not int or event_id <= 0 or event_id in seen:
+            event_id = None
+        event = Event(row.get('name', ''), row.get('date', ''), event_id)
+        seen.add(event.id)
+        events.append(event)
+    return events
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 연간 진행률 바 그라데이션 색상표 (tkinter / flet 공용)
+# - 진행률 30% 미만: 흰색→빨간색 단색, 30% 이상: 초록(#4CAF50)→빨강(#AF5050) 그라데이션
+# - 진행률은 0.1% 단위(bucket)로 묶어 (폭, bucket) 별로 계산 결과를 LRU 캐시에 보관한다.
+#   화면에 표시되는 진행률도 소수 첫째 자리까지이므로 같은 bucket 은 같은 바로 그려진다.
+# - tkinter 는 PhotoImage.put 에 바로 넣을 수 있는 한 줄 문자열,
+#   flet 은 ft.Image(src_base64=...) 에 넣을 PNG 를 받아 쓴다.
+
+import binascii
+import math
+import struct
+import zlib
+from functools import lru_cache
+
+# 채워지지 않은 부분 색
+EMPTY_RGB = (0xFF, 0xFF, 0xFF)
+
+# 캐시할 (폭, bucket) 조합 수
+CACHE_SIZE = 64
+
+
+def progress_bucket(progress):
+    """진행률(%)을 0.1% 단위 정수로 (0 ~ 1000)"""
+    return min(1000, max(0, int(round(progress * 10))))
+
+
+def filled_width(width, progress):
+    """progress(%) 만큼 채워지는 픽셀 수 (i / width < progress / 100 인 i 의 개수)"""
+    ratio = progress / 100
+    filled = min(width, max(0, math.ceil(ratio * width)))
+    # 부동소수점 오차 보정
+    while filled > 0 and not (filled - 1) / width < ratio:
+        filled -= 1
+    while filled < width and filled / width < ratio:
+        filled += 1
+    return filled
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_rgb(width, bucket):
+    """폭 width 인 바의 픽셀별 (r, g, b) 튜플"""
+    progress = bucket / 10
+    filled = filled_width(width, progress)
+    if progress < 30:
+        shade = int((progress / 30) * 255)
+        row = [(255, shade, shade)] * filled
+    else:
+        row = [
+            (int(0x4C + (0xAF - 0x4C) * (i / width)),
+             int(0xAF + (0x50 - 0xAF) * (i / width)),
+             0x50)
+            for i in range(filled)
+        ]
+    row.extend([EMPTY_RGB] * (width - filled))
+    return tuple(row)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_hex(width, bucket):
+    """픽셀별 '#rrggbb' 색 문자열 튜플"""
+    return tuple("#{:02x}{:02x}{:02x}".format(*rgb) for rgb in gradient_rgb(width, bucket))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_tk_row(width, bucket):
+    """tkinter PhotoImage.put 에 넣을 한 줄 데이터 ('{#rrggbb #rrggbb ...}')"""
+    return "{" + " ".join(gradient_hex(width, bucket)) + "}"
+
+
+def _png_chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_png(width, height, bucket):
+    """바 전체를 그린 RGB PNG 바이트"""
+    line = b"\x00" + bytes(channel for rgb in gradient_rgb(width, bucket) for channel in rgb)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(line * height, 9))
+            + _png_chunk(b"IEND", b""))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def gradient_png_base64(width, height, bucket):
+    """ft.Image(src_base64=...) 용 base64 문자열"""
+    return binascii.b2a_base64(gradient_png(width, height, bucket), newline=False).decode("ascii")
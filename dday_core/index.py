@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 일정 색인
+# - id → 일정 조회
+# - 날짜순 / 이름순으로 정렬된 목록을 bisect 삽입/삭제로 유지하여
+#   일정 추가/수정/삭제나 정렬 기준 변경 시 전체를 다시 정렬하지 않는다.
+# - 이름순 목록은 날짜가 있는 일정과 날짜 형식이 잘못된 일정을 따로 유지하고,
+#   오늘 기준으로 나눈 이름순 목록은 날짜가 바뀌거나 색인이 바뀔 때까지 캐시한다.
+
+from bisect import bisect_left
+
+
+class SortedView:
+    """정렬 키 순서를 유지하는 일정 목록
+
+    키는 (정렬 키, 일정 id) 로 만들어 항상 유일하므로 같은 키를 가진
+    일정끼리도 순서가 결정적이다.
+    """
+
+    def __init__(self, key, events=()):
+        self._key = key
+        self._keys_by_id = {}
+        pairs = sorted(((key(event), event.id), event) for event in events)
+        self.keys = [pair[0] for pair in pairs]
+        self.events = [pair[1] for pair in pairs]
+        for full_key in self.keys:
+            self._keys_by_id[full_key[1]] = full_key
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, event):
+        full_key = (self._key(event), event.id)
+        index = bisect_left(self.keys, full_key)
+        self.keys.insert(index, full_key)
+        self.events.insert(index, event)
+        self._keys_by_id[event.id] = full_key
+
+    def remove(self, event):
+        # 일정이 수정되었을 수 있으므로 추가할 때 계산한 키로 위치를 찾는다
+        full_key = self._keys_by_id.pop(event.id)
+        index = bisect_left(self.keys, full_key)
+        del self.keys[index]
+        del self.events[index]
+
+    def bisect(self, key):
+        """정렬 키가 key 이상인 첫 위치"""
+        return bisect_left(self.keys, (key,))
+
+
+def _date_key(event):
+    # 날짜 형식이 잘못된 일정은 맨 뒤로
+    ordinal = event.ordinal
+    return (1, 0) if ordinal is None else (0, ordinal)
+
+
+def _name_key(event):
+    return event.name.lower()
+
+
+class EventIndex:
+    """id 색인과 날짜순/이름순 정렬 목록을 함께 유지하는 일정 모음
+
+    by_name 에는 날짜가 있는 일정만, by_name_invalid 에는 날짜 형식이 잘못된 일정만 들어 있다.
+    """
+
+    def __init__(self, events=()):
+        events = list(events)
+        self._by_id = {event.id: event for event in events}
+        self.by_date = SortedView(_date_key, events)
+        self.by_name = SortedView(_name_key, [event for event in events if event.ordinal is not None])
+        self.by_name_invalid = SortedView(_name_key, [event for event in events if event.ordinal is None])
+        # (오늘 서수, 오늘 이후 일정, 지난 일정) 이름순 캐시, 색인이 바뀌면 None
+        self._name_split = None
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, event_id):
+        return event_id in self._by_id
+
+    def get(self, event_id):
+        """id 로 일정 조회, 없으면 None"""
+        return self._by_id.get(event_id)
+
+    def _name_view(self, event):
+        return self.by_name if event.ordinal is not None else self.by_name_invalid
+
+    def add(self, event):
+        self._by_id[event.id] = event
+        self.by_date.add(event)
+        self._name_view(event).add(event)
+        self._name_split = None
+
+    def remove(self, event):
+        del self._by_id[event.id]
+        self.by_date.remove(event)
+        self._name_view(event).remove(event)
+        self._name_split = None
+
+    def renumber(self, event, new_id):
+        """일정의 id 를 바꾸고 색인을 갱신"""
+        self.remove(event)
+        event.id = new_id
+        self.add(event)
+
+    def update(self, event, name, date):
+        """일정의 이름과 날짜를 바꾸고 정렬 목록 위치를 갱신"""
+        self.by_date.remove(event)
+        self._name_view(event).remove(event)
+        event.name = name
+        event.date = date
+        self.by_date.add(event)
+        self._name_view(event).add(event)
+        self._name_split = None
+
+    def _today_split(self, today):
+        return self.by_date.bisect((0, today))
+
+    def _invalid_split(self):
+        return self.by_date.bisect((1, 0))
+
+    def upcoming(self, today):
+        """오늘 이후 일정 (가까운 날짜부터)"""
+        return self.by_date.events[self._today_split(today):self._invalid_split()]
+
+    def past(self, today):
+        """지나간 일정 (최근 날짜부터)"""
+        return self.by_date.events[:self._today_split(today)][::-1]
+
+    def invalid(self):
+        """날짜 형식이 잘못된 일정"""
+        return self.by_date.events[self._invalid_split():]
+
+    def closest_upcoming(self, today):
+        """오늘 이후 가장 가까운 일정, 없으면 None"""
+        index = self._today_split(today)
+        if index < self._invalid_split():
+            return self.by_date.events[index]
+        return None
+
+    def _split_by_name(self, today):
+        """이름순 (오늘 이후 일정, 지난 일정), 같은 날짜에 색인이 그대로면 캐시를 돌려줌"""
+        cached = self._name_split
+        if cached is None or cached[0] != today:
+            upcoming, past = [], []
+            for event in self.by_name.events:
+                (past if event.ordinal < today else upcoming).append(event)
+            cached = self._name_split = (today, upcoming, past)
+        return cached
+
+    def upcoming_by_name(self, today):
+        """오늘 이후 일정 (이름순, 캐시된 목록이므로 고치지 말 것)"""
+        return self._split_by_name(today)[1]
+
+    def past_by_name(self, today):
+        """지나간 일정 (이름순, 캐시된 목록이므로 고치지 말 것)"""
+        return self._split_by_name(today)[2]
+
+    def invalid_by_name(self):
+        """날짜 형식이 잘못된 일정 (이름순)"""
+        return self.by_name_invalid.events[:]
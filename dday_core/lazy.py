@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 무거운 GUI 모듈(flet 등)을 실제로 사용할 때까지 import 를 미루는 대리 객체
+
+import importlib
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 모듈을 import 하는 대리 객체"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    @property
+    def loaded(self):
+        """모듈이 이미 import 되었는지"""
+        return self._module is not None
+
+
+def lazy_import(name):
+    """name 모듈의 지연 import 대리 객체"""
+    return LazyModule(name)
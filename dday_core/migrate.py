@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 기존 dday_data.json / d-day.csv 를 sqlite 저장소로 옮기는 도구
+#
+# 사용법: python -m dday_core.migrate dday_data.db [dday_data.json] [d-day.csv]
+
+import sys
+
+from .storage import migrate_to_sqlite
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or len(argv) > 3:
+        print("사용법: python -m dday_core.migrate <db 파일> [json 파일] [csv 파일]")
+        return 2
+    count = migrate_to_sqlite(*argv)
+    print(f"{count}개의 일정을 {argv[0]} 로 옮겼습니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
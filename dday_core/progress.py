@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 연간 진행률 계산 (tkinter / flet 공용)
+# - ProgressEngine 은 지정한 시간대 기준으로 올해 지난 시간을 마이크로초 단위까지
+#   반영하고, 표시 값이 다음에 바뀌는 시각을 알려 준다
+# - 두 앱의 "오늘" 날짜도 ProgressEngine.today() 로 같은 시간대에서 얻는다
+
+import datetime
+
+# 남은 일수가 이보다 적으면 남은 날짜 표시를 깜빡임
+BLINK_THRESHOLD_DAYS = 10
+
+
+def should_blink(days_left):
+    """남은 일수 표시를 깜빡여야 하는지"""
+    return days_left < BLINK_THRESHOLD_DAYS
+
+
+_MICROSECOND = datetime.timedelta(microseconds=1)
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _to_us(moment):
+    """aware datetime → UTC 기준 마이크로초 (서머타임 등 시간대 오프셋 반영)"""
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def resolve_timezone(tz):
+    """시간대 이름(예: "Asia/Seoul") 또는 tzinfo → tzinfo (None 이면 로컬 시간)"""
+    if tz is None or isinstance(tz, datetime.tzinfo):
+        return tz
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(tz)
+    except Exception as e:
+        print(f"Unknown timezone {tz!r}, using local time: {e}")
+        return None
+
+
+class ProgressEngine:
+    """연간 진행률 계산기 (tkinter / flet 공용)
+
+    - 시간대 tz 의 달력 기준으로 올해 진행률을 마이크로초 단위까지 계산한다.
+    - 올해 시작/끝 시각은 해가 바뀔 때까지 캐시한다.
+    - next_change 는 표시 값(진행률, 날짜)이 다음에 바뀌는 시각을 돌려주므로
+      호출하는 쪽이 그 시각에 맞춰 다시 그릴 수 있다.
+
+    now 인자는 aware datetime 이면 tz 로 변환하고, naive 이면 tz 의 시각으로 본다.
+    """
+
+    def __init__(self, tz=None):
+        self.tz = resolve_timezone(tz)
+        # 캐시된 올해 시작/끝 시각과 그 UTC 마이크로초
+        self._start = None
+        self._end = None
+        self._start_us = 0
+        self._end_us = 0
+
+    def now(self):
+        """tz 기준 현재 시각 (aware datetime)"""
+        if self.tz is None:
+            return datetime.datetime.now().astimezone()
+        return datetime.datetime.now(self.tz)
+
+    def today(self):
+        """tz 기준 오늘 날짜 (datetime.date)"""
+        return self.now().date()
+
+    def _localize(self, naive):
+        if self.tz is None:
+            return naive.astimezone()
+        return naive.replace(tzinfo=self.tz)
+
+    def _coerce(self, now):
+        if now is None:
+            return self.now()
+        if now.tzinfo is None:
+            return self._localize(now)
+        return now.astimezone(self.tz)
+
+    def _update_period(self, now):
+        """now 가 캐시된 기간 밖이면 올해 시작/끝을 다시 계산하고 now 의 마이크로초 반환"""
+        now_us = _to_us(now)
+        if self._start is None or not self._start_us <= now_us < self._end_us:
+            self._start = self._localize(datetime.datetime(now.year, 1, 1))
+            self._end = self._localize(datetime.datetime(now.year + 1, 1, 1))
+            self._start_us = _to_us(self._start)
+            self._end_us = _to_us(self._end)
+        return now_us
+
+    def progress(self, now=None):
+        """올해 진행률 % (마이크로초 단위)"""
+        now_us = self._update_period(self._coerce(now))
+        return (now_us - self._start_us) * 100 / (self._end_us - self._start_us)
+
+    def days(self, now=None):
+        """(지난 일수, 연말까지 남은 일수, 올해 일수) - 오늘을 지난 일수에 포함"""
+        now = self._coerce(now)
+        self._update_period(now)
+        total_days = (self._end.date() - self._start.date()).days
+        days_remaining = (self._end.date() - now.date()).days - 1
+        return total_days - days_remaining, days_remaining, total_days
+
+    def next_change(self, decimals=1, now=None):
+        """소수 decimals 자리로 반올림한 진행률이나 날짜가 다음에 바뀌는 시각"""
+        now = self._coerce(now)
+        now_us = self._update_period(now)
+        elapsed = now_us - self._start_us
+        span = self._end_us - self._start_us
+        # 진행률 표시 값 k / 10**decimals 가 k + 1 로 바뀌는 경과 시간 (정수 연산)
+        # 반올림 경계를 정확히 지난 첫 마이크로초를 돌려준다
+        scale = 100 * 10 ** decimals
+        k = (2 * elapsed * scale + span) // (2 * span)
+        boundary = (2 * k + 1) * span // (2 * scale) + 1
+        change = (_EPOCH + (self._start_us + boundary) * _MICROSECOND).astimezone(self.tz)
+        midnight = self._localize(datetime.datetime.combine(now.date() + datetime.timedelta(days=1), datetime.time()))
+        return min(change, midnight, self._end)
@@ -0,0 +1,847 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 일정 저장소 (tkinter / flet 공용)
+# - EventStore: 저장소 공통 인터페이스 (load / put / delete / sync / compact)
+# - JsonJournalStore: dday_data.json 스냅샷 + 변경 내역을 한 줄씩 덧붙이는 저널
+# - CsvStore: tkinter 앱의 d-day.csv (이름,연,월,일)
+# - SqliteStore: 날짜/이름 색인을 가진 sqlite3 데이터베이스 (필요한 구간만 조회 가능)
+# - PagedEvents: 저장소 조회 결과를 앞에서부터 필요한 만큼만 읽는 일정 목록
+# - open_store: 파일 확장자로 저장소 선택
+# - migrate_to_sqlite: 기존 dday_data.json / d-day.csv 를 sqlite 로 한 번에 옮김
+# - merge_legacy_csv: 예전 tkinter 앱의 d-day.csv 를 두 앱 공용 파일로 한 번 합침
+#
+# 두 앱이 같은 파일을 쓰는 경우를 위해
+# - 파일 쓰기는 '<파일>.lock' 잠금 파일로 직렬화하고,
+# - 마지막으로 읽거나 쓴 뒤 다른 프로그램이 파일을 바꿨으면 그 내용을 다시 읽어
+#   합친 뒤 기록한다.
+# - 두 앱은 각자 마지막 id 다음 번호를 발급하므로 새 일정끼리 id 가 겹칠 수 있다.
+#   이 저장소가 모르는 id 가 파일에 다른 일정으로 이미 있으면 기록하는 일정의
+#   event.id 를 새 번호로 바꿔 기록한다 (다른 프로그램의 일정을 덮어쓰지 않음).
+# - 이 저장소가 기록했던 일정이 파일에서 사라졌으면 다른 프로그램이 지운 것이므로
+#   스냅샷을 쓸 때 다시 넣지 않는다.
+# - load 는 파일 상태(수정 시각, 크기)가 그대로면 다시 해석하지 않고 캐시를 쓴다.
+#
+# 일정을 하나 추가/수정/삭제할 때마다 파일 전체를 다시 쓰지 않고 저널에
+# 한 줄만 덧붙인다. 저널이 일정 길이를 넘으면 스냅샷으로 합친다(compaction).
+# 스냅샷은 임시 파일에 쓴 뒤 이름을 바꿔 교체하므로 쓰는 도중 종료되어도
+# 기존 파일이 깨지지 않는다. 저널의 각 줄에는 CRC32 가 붙어 있어서 마지막 줄이
+# 중간에 잘린 경우(torn write)를 찾아내 건너뛴다.
+
+import datetime
+import json
+import os
+import threading
+import time
+import zlib
+from collections import Counter
+from contextlib import contextmanager
+
+from .csvfile import read_csv_events, write_csv_rows
+from .event import Event, _allocate_id, events_from_dicts
+from .lazy import lazy_import
+
+# sqlite 저장소를 쓸 때만 import
+sqlite3 = lazy_import('sqlite3')
+
+# 두 앱이 DDAY_DATA_FILE 을 지정하지 않았을 때 함께 쓰는 저장 파일
+DEFAULT_DATA_FILE = 'dday_data.json'
+# 예전 tkinter 앱이 쓰던 CSV 파일
+LEGACY_CSV_FILE = 'd-day.csv'
+
+# 저널 기록이 이 개수를 넘으면 스냅샷으로 합침
+COMPACT_EVERY = 500
+
+# 잠금 파일을 기다리는 최대 시간(초) / 이보다 오래된 잠금 파일은 비정상 종료로 보고 지움
+LOCK_TIMEOUT = 5.0
+LOCK_STALE = 30.0
+
+
+def _encode_record(record):
+    """저널 한 줄: '<crc32 8자리> <json>\\n'"""
+    payload = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+
+def _decode_record(line):
+    """저널 한 줄을 해석, 손상된 줄이면 None"""
+    if not line.endswith('\n') or len(line) < 10 or line[8] != ' ':
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload.encode('utf-8')):
+            return None
+        record = json.loads(payload)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 교체하여 JSON 파일을 원자적으로 저장"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+@contextmanager
+def file_lock(path, timeout=LOCK_TIMEOUT):
+    """'<path>.lock' 파일로 다른 프로그램(또는 스레드)과 쓰기를 직렬화
+
+    timeout 초 안에 잠금을 얻지 못하면 TimeoutError 를 낸다.
+    """
+    lock_path = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            # 오래된 잠금 파일은 지우고 다시 시도 (확인/삭제에 실패해도 기한은 지킴)
+            try:
+                if time.time() - os.path.getmtime(lock_path) > LOCK_STALE:
+                    os.remove(lock_path)
+            except OSError:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{lock_path} is held by another process")
+            time.sleep(0.05)
+    try:
+        os.write(fd, str(os.getpid()).encode('ascii'))
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+def _file_stat(path):
+    """파일 변경 확인용 (수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _row_key(row):
+    """저장된 행의 (이름, 날짜), 행이 없으면 None"""
+    return None if row is None else (row.get('name', ''), row.get('date', ''))
+
+
+def _sync_key(event):
+    """sync 에서 일정이 바뀌었는지 비교하는 값"""
+    ordinal = event.ordinal
+    return (event.name, event.date if ordinal is None else ordinal)
+
+
+class EventStore:
+    """저장소 공통 인터페이스
+
+    load 결과는 파일 상태(signature)가 바뀌지 않는 동안 캐시되며,
+    캐시에는 (id, 이름, 날짜) 만 보관하고 부를 때마다 새 Event 를 만든다.
+    """
+
+    # 저장소가 주기적으로 compact 를 필요로 하는지
+    needs_compaction = False
+    # 전체를 읽지 않고 날짜/이름순 구간 조회(upcoming / past / invalid)를 할 수 있는지
+    supports_range_queries = False
+
+    def __init__(self):
+        # 마지막 load 에서 읽지 못한 항목 [(위치, 사유)]
+        self.errors = []
+        # load 캐시와 그때의 파일 상태
+        self._cache = None
+        self._seen = None
+        # 마지막으로 load / sync 한 일정 id → _sync_key
+        self._synced = {}
+        # 이 저장소가 파일에서 읽었거나 직접 기록한 일정 id
+        # (여기 없는 id 가 파일에 있으면 다른 프로그램이 기록한 일정)
+        self._stored_ids = set()
+
+    def _signature(self):
+        """파일 상태, 변경 여부를 알 수 없는 저장소는 None"""
+        return None
+
+    def _changed_on_disk(self):
+        """마지막으로 읽거나 쓴 뒤 다른 프로그램이 파일을 바꿨는지"""
+        return self._seen is not None and self._signature() != self._seen
+
+    def _wrote(self):
+        """이 저장소가 파일을 쓴 뒤 호출 (캐시 무효화, 파일 상태 갱신)"""
+        self._cache = None
+        if self._seen is not None:
+            self._seen = self._signature()
+
+    def load(self):
+        """저장된 일정을 Event 목록으로 반환"""
+        signature = self._signature()
+        if self._cache is None or signature is None or signature != self._seen:
+            events = self._load()
+            self._cache = [(event.id, event.name, event.date_obj or event.date) for event in events]
+            self._seen = self._signature()
+        else:
+            events = [Event(name, date, event_id) for event_id, name, date in self._cache]
+        self._synced = {event.id: _sync_key(event) for event in events}
+        return events
+
+    def _load(self):
+        """파일을 읽어 Event 목록으로 반환 (캐시 없이)"""
+        raise NotImplementedError
+
+    def sync(self, events):
+        """앱이 가진 전체 일정을 마지막 load / sync 와 비교해 바뀐 것만 기록, 성공 여부 반환"""
+        current = {event.id: _sync_key(event) for event in events}
+        changed = [event for event in events if self._synced.get(event.id) != current[event.id]]
+        deleted = [event_id for event_id in self._synced if event_id not in current]
+        if not changed and not deleted:
+            return True
+        ok = self.write_batch(changed, deleted)
+        if ok:
+            # 기록하면서 새 id 를 받은 일정이 있을 수 있으므로 id 는 다시 읽음
+            self._synced = {event.id: key for event, key in zip(events, current.values())}
+        return ok
+
+    def _renumber_conflicts(self, events, stored_row, max_id):
+        """다른 프로그램이 같은 id 로 기록한 다른 일정과 겹치는 일정에 새 id 발급
+
+        이 저장소가 모르는 id 가 파일에 다른 (이름, 날짜) 로 기록되어 있으면
+        event.id 를 파일의 가장 큰 id 보다 큰 번호로 바꾼다.
+        stored_row(id) 는 파일에 기록된 (이름, 날짜) 또는 None, max_id() 는 파일의 가장 큰 id.
+        """
+        reserved = False
+        for event in events:
+            if event.id in self._stored_ids:
+                continue
+            stored = stored_row(event.id)
+            if stored is None or tuple(stored) == (event.name, event.date):
+                continue
+            if not reserved:
+                _allocate_id(max_id() or 0)
+                reserved = True
+            event.id = _allocate_id()
+
+    def put(self, event):
+        """일정 하나 추가/수정, 성공 여부 반환"""
+        raise NotImplementedError
+
+    def delete(self, event_id):
+        """일정 하나 삭제, 성공 여부 반환"""
+        raise NotImplementedError
+
+    def write_batch(self, events, deleted_ids):
+        """여러 일정의 추가/수정과 삭제를 한 번에 기록, 성공 여부 반환
+
+        다른 프로그램의 일정과 id 가 겹치는 일정은 event.id 가 새 번호로 바뀔 수 있다.
+        """
+        ok = True
+        for event in events:
+            ok = self.put(event) and ok
+        for event_id in deleted_ids:
+            ok = self.delete(event_id) and ok
+        return ok
+
+    def compact(self, events):
+        """전체 일정을 통째로 저장, 성공 여부 반환"""
+        raise NotImplementedError
+
+    def close(self):
+        """열린 자원 정리"""
+        pass
+
+
+class JsonJournalStore(EventStore):
+    """JSON 스냅샷 + 추가 기록 저널 저장소"""
+
+    def __init__(self, path, compact_every=COMPACT_EVERY):
+        super().__init__()
+        self.path = path
+        self.journal_path = f"{path}.journal"
+        self.compact_every = compact_every
+        self.journal_records = 0
+        # id 없는 예전 형식 파일을 읽은 경우, 메모리에서 발급한 id 로 만든 행 (id → 행)
+        # 저널에 덧붙이면 다음에 읽을 때 id 가 어긋나므로 처음 저장할 때 스냅샷으로 통째로 씀
+        self._unsaved_rows = None
+        # 파일을 다시 읽었을 때 본 다른 프로그램의 일정 (id → 행)
+        # 새 일정의 id 가 겹치는지 확인하고, 스냅샷을 쓸 때 함께 남기는 데 사용
+        self._foreign_rows = {}
+        # 이 저장소가 읽거나 기록한 뒤 다른 프로그램이 지운 일정 id (스냅샷에 다시 넣지 않음)
+        self._removed_ids = set()
+
+    @property
+    def needs_compaction(self):
+        """저널이 길어져 스냅샷으로 합칠 때가 되었는지"""
+        return self.journal_records >= self.compact_every
+
+    def _read_snapshot(self):
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            print(f"Error loading data: {e}")
+            return []
+        if isinstance(data, list) and all(isinstance(item, dict) for item in data):
+            return data
+        print("Warning: Data file does not contain a valid list of events. Starting fresh.")
+        return []
+
+    def _replay_journal(self, rows):
+        """저널을 스냅샷 행 위에 적용, 손상된 줄이 있었는지 반환
+
+        읽기만 하고 파일은 고치지 않는다 (잠금 없이 읽으므로 다른 프로그램이 쓰는 중인
+        마지막 줄이 잘려 보일 수 있음). 잘린 마지막 줄은 _append 가 잠금 안에서 잘라낸다.
+        """
+        if not os.path.exists(self.journal_path):
+            return False
+
+        damaged = False
+        self.journal_records = 0
+        with open(self.journal_path, 'rb') as f:
+            for raw in f:
+                try:
+                    record = _decode_record(raw.decode('utf-8'))
+                except UnicodeDecodeError:
+                    record = None
+                if record is None:
+                    print(f"Warning: skipping damaged journal record: {raw[:60]!r}")
+                    damaged = True
+                    continue
+                self.journal_records += 1
+                event_id = record.get('id')
+                if record.get('op') == 'put':
+                    rows[event_id] = {'id': event_id, 'name': record.get('name', ''), 'date': record.get('date', '')}
+                elif record.get('op') == 'del':
+                    rows.pop(event_id, None)
+        return damaged
+
+    @staticmethod
+    def _trim_torn_tail(f):
+        """저널 끝이 줄바꿈 없이 끝났으면(쓰는 도중 종료) 마지막 줄바꿈 뒤를 잘라냄
+
+        다음 기록이 잘린 줄에 이어 붙어 함께 버려지지 않게 한다.
+        잠금을 잡고 있어 다른 프로그램이 쓰는 중이 아닐 때만 호출한다.
+        """
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            return
+        position = end
+        while position > 0:
+            start = max(0, position - 4096)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline >= 0:
+                f.truncate(start + newline + 1)
+                return
+            position = start
+        f.truncate(0)
+
+    def _signature(self):
+        return (_file_stat(self.path), _file_stat(self.journal_path))
+
+    def _read_rows(self):
+        """스냅샷에 저널을 적용한 (id → 행, id 없는 행 목록, 저널 손상 여부)"""
+        rows = {}
+        anonymous = []
+        for row in self._read_snapshot():
+            event_id = row.get('id')
+            if type(event_id) is int and event_id > 0 and event_id not in rows:
+                rows[event_id] = row
+            else:
+                anonymous.append(row)
+
+        damaged = self._replay_journal(rows)
+        return rows, anonymous, damaged
+
+    def _load(self):
+        """스냅샷과 저널을 읽어 Event 목록으로 반환
+
+        id 가 없는 예전 형식 파일이어도 읽기만 해서는 파일을 바꾸지 않는다.
+        id 는 메모리에서만 발급하고, 처음 저장할 때 새 스냅샷으로 기록한다.
+        """
+        rows, anonymous, _ = self._read_rows()
+        events = events_from_dicts(list(rows.values()) + anonymous)
+        self._stored_ids = set(rows)
+        self._foreign_rows = {}
+        self._removed_ids = set()
+        self._unsaved_rows = {event.id: event.to_dict() for event in events} if anonymous else None
+        return events
+
+    def _append(self, events, deleted_ids):
+        try:
+            with file_lock(self.path):
+                if self._changed_on_disk():
+                    # 다른 프로그램이 쓴 기록의 id 뒤로 새 id 를 발급하도록 맞추고,
+                    # 그 기록과 id 가 겹친 새 일정은 새 id 로 기록
+                    rows = self._read_rows()[0]
+                    if rows:
+                        _allocate_id(max(rows))
+                    self._note_disk_rows(rows)
+                self._renumber_conflicts(events, self._foreign_key, lambda: max(self._foreign_rows))
+                records = [self._put_record(event) for event in events]
+                records.extend({'op': 'del', 'id': event_id} for event_id in deleted_ids)
+                with open(self.journal_path, 'a+b') as f:
+                    self._trim_torn_tail(f)
+                    f.write(''.join(_encode_record(record) for record in records).encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.journal_records += len(records)
+                for event in events:
+                    self._stored_ids.add(event.id)
+                    self._foreign_rows.pop(event.id, None)
+                    self._removed_ids.discard(event.id)
+                for event_id in deleted_ids:
+                    self._stored_ids.discard(event_id)
+                    self._foreign_rows.pop(event_id, None)
+                self._wrote()
+        except IOError as e:
+            print(f"Error saving data: {e}")
+            return False
+        return True
+
+    def _note_disk_rows(self, rows):
+        """다시 읽은 행에서 다른 프로그램이 기록한 일정과 지운 일정을 기억"""
+        self._foreign_rows = {event_id: row for event_id, row in rows.items() if event_id not in self._stored_ids}
+        removed = {event_id for event_id in self._stored_ids if event_id not in rows}
+        if removed:
+            self._removed_ids |= removed
+            self._stored_ids -= removed
+
+    def _foreign_key(self, event_id):
+        return _row_key(self._foreign_rows.get(event_id))
+
+    @staticmethod
+    def _put_record(event):
+        return {'op': 'put', 'id': event.id, 'name': event.name, 'date': event.date}
+
+    def put(self, event):
+        """일정 추가/수정 기록"""
+        return self.write_batch([event], [])
+
+    def delete(self, event_id):
+        """일정 삭제 기록"""
+        return self.write_batch([], [event_id])
+
+    def write_batch(self, events, deleted_ids):
+        """여러 변경을 저널에 한 번에 덧붙임 (fsync 한 번)
+
+        예전 형식 파일을 읽은 뒤 처음 저장하는 경우에는 변경을 반영한 새 스냅샷을 쓴다.
+        """
+        if self._unsaved_rows is not None:
+            rows = dict(self._unsaved_rows)
+            for event in events:
+                rows.pop(event.id, None)
+            for event_id in deleted_ids:
+                rows.pop(event_id, None)
+            return self._write_snapshot(list(rows.values()), events)
+
+        if not events and not deleted_ids:
+            return True
+        return self._append(events, deleted_ids)
+
+    def compact(self, events):
+        """전체 일정을 새 스냅샷으로 저장하고 저널을 비움
+
+        다른 프로그램이 그 사이 파일을 바꿨으면 디스크의 일정에 events 를 덮어써서
+        다른 프로그램이 추가한 일정을 잃지 않게 하고, 지운 일정은 되살리지 않는다. 아직 기록한 적 없는 일정이
+        다른 프로그램의 일정과 id 가 겹치면 그 일정은 쓰지 않는다
+        (사본만 받으므로 id 를 바꿀 수 없음, 다음 write_batch 가 새 id 로 기록한다).
+        """
+        return self._write_snapshot([event.to_dict() for event in events])
+
+    def _write_snapshot(self, rows, events=()):
+        """rows 와 events 를 새 스냅샷으로 쓰고 저널을 비움
+
+        다른 프로그램이 기록한 일정은 그대로 남기고, 지운 일정은 rows 에 있어도 다시 넣지 않는다.
+        이 저장소가 모르는 id 가 다른 프로그램의 일정과 겹치면 events 의 일정은 새 id 로 바꿔 쓰고,
+        rows 의 행은 쓰지 않는다.
+        """
+        try:
+            with file_lock(self.path):
+                anonymous = []
+                if self._changed_on_disk():
+                    disk_rows, anonymous, _ = self._read_rows()
+                    if disk_rows:
+                        _allocate_id(max(disk_rows))
+                    self._note_disk_rows(disk_rows)
+                self._renumber_conflicts(events, self._foreign_key, lambda: max(self._foreign_rows))
+                # 다른 프로그램이 지운 일정과, 모르는 id 가 다른 일정과 겹치는 행은 쓰지 않음
+                ours = [row for row in rows if row['id'] not in self._removed_ids
+                        and self._foreign_key(row['id']) in (None, _row_key(row))]
+                ours.extend(event.to_dict() for event in events)
+                merged = dict(self._foreign_rows)
+                merged.update((row['id'], row) for row in ours)
+                write_json_atomic(self.path, list(merged.values()) + anonymous)
+                # 스냅샷 교체 후 저널을 비우기 전에 종료되더라도,
+                # 저널 기록은 같은 결과를 다시 적용할 뿐이므로 안전하다
+                with open(self.journal_path, 'w', encoding='utf-8'):
+                    pass
+                self.journal_records = 0
+                self._unsaved_rows = None
+                self._stored_ids = {row['id'] for row in ours}
+                for event_id in self._stored_ids:
+                    self._foreign_rows.pop(event_id, None)
+                self._wrote()
+        except IOError as e:
+            print(f"Error saving data: {e}")
+            return False
+        return True
+
+
+class CsvStore(EventStore):
+    """tkinter 앱의 d-day.csv (이름,연,월,일) 저장소
+
+    CSV 는 일부만 고쳐 쓸 수 없으므로 변경이 있을 때마다 파일 전체를 다시 쓰되,
+    내용이 바뀌지 않았으면 쓰지 않는다. 파일에는 id 가 없으므로 읽을 때마다
+    새 id 가 발급되고, 날짜 형식이 잘못된 일정은 저장되지 않는다.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        # 파일에 기록된 내용: 일정 id → (이름, 날짜 서수)
+        self._rows = {}
+
+    def _signature(self):
+        return _file_stat(self.path)
+
+    def _load(self):
+        self.errors = []
+        events = read_csv_events(self.path, self.errors)
+        for line_number, reason in self.errors:
+            print(f"Skipping {self.path} line {line_number}: {reason}")
+        self._rows = {event.id: (event.name, event.ordinal) for event in events}
+        return events
+
+    def _merge_disk(self):
+        """다른 프로그램이 바꾼 파일 내용을 self._rows 에 반영
+
+        마지막으로 알던 내용과 비교하여 지워진 줄은 지우고, 추가된 줄은 새 id 로 넣는다.
+        """
+        disk = Counter((event.name, event.ordinal) for event in read_csv_events(self.path))
+        known = Counter(self._rows.values())
+        removed = known - disk
+        added = disk - known
+        for event_id, row in list(self._rows.items()):
+            if removed[row] > 0:
+                removed[row] -= 1
+                del self._rows[event_id]
+        for row, count in added.items():
+            for _ in range(count):
+                self._rows[_allocate_id()] = row
+
+    def _write_rows(self, rows):
+        ordered = sorted(rows.values(), key=lambda row: row[1])
+        write_csv_rows(self.path, (
+            (name, date_obj.year, date_obj.month, date_obj.day)
+            for name, date_obj in ((name, datetime.date.fromordinal(ordinal)) for name, ordinal in ordered)
+        ))
+
+    def put(self, event):
+        return self.write_batch([event], [])
+
+    def delete(self, event_id):
+        return self.write_batch([], [event_id])
+
+    def write_batch(self, events, deleted_ids):
+        try:
+            with file_lock(self.path):
+                # 읽은 적이 없거나 다른 프로그램이 바꾼 경우 파일 내용부터 반영
+                if self._seen is None or self._changed_on_disk():
+                    self._merge_disk()
+                rows = dict(self._rows)
+                for event in events:
+                    if event.ordinal is None:
+                        rows.pop(event.id, None)
+                    else:
+                        rows[event.id] = (event.name, event.ordinal)
+                for event_id in deleted_ids:
+                    rows.pop(event_id, None)
+                if rows == self._rows and os.path.exists(self.path):
+                    return True
+                self._write_rows(rows)
+                self._rows = rows
+                self._cache = None
+                self._seen = self._signature()
+        except (IOError, ValueError) as e:
+            print(f"Error saving data: {e}")
+            return False
+        return True
+
+    def compact(self, events):
+        """전체 일정 저장 (다른 프로그램이 추가한 일정은 유지)"""
+        return self.sync(events)
+
+
+class SqliteStore(EventStore):
+    """sqlite3 저장소
+
+    날짜 서수와 이름에 색인이 있어 다가오는/지나간 일정 조회가 필요한 구간만 읽고,
+    일정 하나의 추가/수정/삭제는 id(기본 키) 행 하나만 건드린다.
+    이름순은 대소문자를 구분하지 않는 sqlite 의 NOCASE 순서를 따른다.
+    """
+
+    supports_range_queries = True
+
+    # 조회 구간 → (WHERE 절, 날짜순 정렬)
+    _RANGES = {
+        'upcoming': ("ordinal >= ?", "ordinal, id"),
+        'past': ("ordinal < ?", "ordinal DESC, id DESC"),
+        'invalid': ("ordinal IS NULL", "id"),
+    }
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        # 쓰기 스레드(WriteBehindWriter)에서도 사용하므로 잠금으로 접근을 직렬화
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                date TEXT NOT NULL,
+                ordinal INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS events_ordinal ON events (ordinal);
+            CREATE INDEX IF NOT EXISTS events_name ON events (name COLLATE NOCASE);
+            """
+        )
+
+    def _events(self, cursor):
+        return events_from_dicts([{'id': row[0], 'name': row[1], 'date': row[2]} for row in cursor])
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._events(self.conn.execute(sql, params).fetchall())
+
+    def _load(self):
+        events = self._query("SELECT id, name, date FROM events ORDER BY id")
+        self._stored_ids = {event.id for event in events}
+        return events
+
+    def _range(self, name, params, limit, offset, by_name):
+        where, order = self._RANGES[name]
+        if by_name:
+            order = "name COLLATE NOCASE, id"
+        events = self._query(f"SELECT id, name, date FROM events WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                             params + (limit, offset))
+        self._stored_ids.update(event.id for event in events)
+        return events
+
+    def _count(self, name, params):
+        with self._lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM events WHERE {self._RANGES[name][0]}", params).fetchone()[0]
+
+    def upcoming(self, today_ordinal, limit=-1, offset=0, by_name=False):
+        """오늘 이후 일정 (가까운 날짜부터, by_name 이면 이름순)"""
+        return self._range('upcoming', (today_ordinal,), limit, offset, by_name)
+
+    def past(self, today_ordinal, limit=-1, offset=0, by_name=False):
+        """지나간 일정 (최근 날짜부터, by_name 이면 이름순)"""
+        return self._range('past', (today_ordinal,), limit, offset, by_name)
+
+    def invalid(self, limit=-1, offset=0, by_name=False):
+        """날짜 형식이 잘못된 일정"""
+        return self._range('invalid', (), limit, offset, by_name)
+
+    def count_upcoming(self, today_ordinal):
+        return self._count('upcoming', (today_ordinal,))
+
+    def count_past(self, today_ordinal):
+        return self._count('past', (today_ordinal,))
+
+    def count_invalid(self):
+        return self._count('invalid', ())
+
+    def closest_upcoming(self, today_ordinal):
+        """오늘 이후 가장 가까운 일정, 없으면 None"""
+        events = self.upcoming(today_ordinal, 1)
+        return events[0] if events else None
+
+    def reserve_ids(self):
+        """전체를 읽지 않고 일정을 만들 때, 저장된 가장 큰 id 뒤로 새 id 를 발급하도록 맞춤"""
+        with self._lock:
+            _allocate_id(self._max_id() or 0)
+
+    @staticmethod
+    def _row(event):
+        return (event.id, event.name, event.date, event.ordinal)
+
+    def _write(self, *statements):
+        """(sql, 파라미터 목록) 들을 한 트랜잭션으로 실행"""
+        try:
+            with self._lock, self.conn:
+                for sql, rows in statements:
+                    self.conn.executemany(sql, rows)
+        except sqlite3.Error as e:
+            print(f"Error saving data: {e}")
+            return False
+        return True
+
+    def put(self, event):
+        return self.write_batch([event], [])
+
+    def delete(self, event_id):
+        return self.write_batch([], [event_id])
+
+    def _stored_row(self, event_id):
+        return self.conn.execute("SELECT name, date FROM events WHERE id = ?", (event_id,)).fetchone()
+
+    def _max_id(self):
+        return self.conn.execute("SELECT MAX(id) FROM events").fetchone()[0]
+
+    def write_batch(self, events, deleted_ids):
+        try:
+            with self._lock, self.conn:
+                # id 가 겹치는지 확인하고 기록할 때까지 다른 프로그램의 쓰기를 막음
+                self.conn.execute("BEGIN IMMEDIATE")
+                self._renumber_conflicts(events, self._stored_row, self._max_id)
+                self.conn.executemany("INSERT OR REPLACE INTO events (id, name, date, ordinal) VALUES (?, ?, ?, ?)",
+                                      [self._row(event) for event in events])
+                self.conn.executemany("DELETE FROM events WHERE id = ?", [(event_id,) for event_id in deleted_ids])
+        except sqlite3.Error as e:
+            print(f"Error saving data: {e}")
+            return False
+        self._stored_ids.update(event.id for event in events)
+        self._stored_ids.difference_update(deleted_ids)
+        return True
+
+    def compact(self, events):
+        ok = self._write(
+            ("DELETE FROM events", [()]),
+            ("INSERT INTO events (id, name, date, ordinal) VALUES (?, ?, ?, ?)", [self._row(event) for event in events]),
+        )
+        if ok:
+            self._stored_ids = {event.id for event in events}
+        return ok
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class PagedEvents:
+    """저장소 조회 결과를 이어 붙인 일정 목록 (앞에서부터 필요한 만큼만 읽음)
+
+    parts: (fetch(limit, offset) → Event 목록, count() → 개수) 목록
+    adopt: 읽은 Event 목록을 앱이 쓸 객체 목록으로 바꾸는 함수 (생략하면 그대로)
+    len() 과 앞에서부터의 슬라이스 [:n] 만 지원한다.
+    """
+
+    def __init__(self, parts, adopt=None):
+        self._parts = parts
+        self._adopt = adopt
+        self._events = []
+        # 지금 읽고 있는 조회와 그 안에서의 위치
+        self._part = 0
+        self._offset = 0
+        self._length = None
+
+    def __len__(self):
+        if self._length is None:
+            self._length = sum(count() for _, count in self._parts)
+        return self._length
+
+    def _fill(self, stop):
+        while len(self._events) < stop and self._part < len(self._parts):
+            wanted = stop - len(self._events)
+            events = self._parts[self._part][0](wanted, self._offset)
+            self._offset += len(events)
+            if len(events) < wanted:
+                self._part += 1
+                self._offset = 0
+            if self._adopt is not None:
+                events = self._adopt(events)
+            self._events.extend(events)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice) or index.start or index.step not in (None, 1) \
+                or (index.stop is not None and index.stop < 0):
+            raise TypeError("PagedEvents only supports [:n] slices")
+        self._fill(len(self) if index.stop is None else index.stop)
+        return self._events[index]
+
+
+# sqlite 저장소로 여는 파일 확장자
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+# CSV 저장소로 여는 파일 확장자
+CSV_SUFFIXES = ('.csv',)
+
+
+def open_store(path):
+    """파일 확장자에 맞는 저장소 생성 (.db/.sqlite → sqlite, .csv → CSV, 그 외 → JSON 저널)
+
+    파일은 load 를 부를 때 읽는다.
+    """
+    lower = path.lower()
+    if lower.endswith(SQLITE_SUFFIXES):
+        return SqliteStore(path)
+    if lower.endswith(CSV_SUFFIXES):
+        return CsvStore(path)
+    return JsonJournalStore(path)
+
+
+def _new_csv_events(events, csv_events):
+    """csv_events 중 events 에 같은 이름과 날짜의 일정이 없는 것 (events 쪽 개수만큼만 건너뜀)"""
+    existing = Counter((event.name, event.date) for event in events)
+    new = []
+    for event in csv_events:
+        key = (event.name, event.date)
+        if existing[key] > 0:
+            existing[key] -= 1
+        else:
+            new.append(event)
+    return new
+
+
+def merge_legacy_csv(json_path=DEFAULT_DATA_FILE, csv_path=LEGACY_CSV_FILE):
+    """예전 tkinter 앱의 CSV 일정을 JSON 저장 파일에 합치고 합친 개수 반환
+
+    JSON 에 이미 같은 이름과 날짜의 일정이 있는 줄은 건너뛴다.
+    합친 뒤 CSV 파일은 '<csv>.migrated' 로 이름을 바꿔 원본을 남기고,
+    다음 실행부터는 다시 합치지 않는다. 기록에 실패하면 CSV 를 그대로 둔다.
+    """
+    if not os.path.exists(csv_path):
+        return 0
+    store = JsonJournalStore(json_path)
+    added = _new_csv_events(store.load(), CsvStore(csv_path).load())
+    if added and not store.write_batch(added, []):
+        return 0
+    try:
+        os.replace(csv_path, f"{csv_path}.migrated")
+    except OSError as e:
+        print(f"Error renaming {csv_path}: {e}")
+    return len(added)
+
+
+def migrate_to_sqlite(db_path, json_path=DEFAULT_DATA_FILE, csv_path=LEGACY_CSV_FILE):
+    """기존 JSON / CSV 일정을 sqlite 저장소로 옮기고 옮긴 개수 반환
+
+    이미 일정이 들어 있는 데이터베이스에는 다시 옮기지 않는다(0 반환).
+    JSON 일정은 모두 옮기고, CSV 일정 중 JSON 에 같은 이름과 날짜의 일정이 있는 것만
+    (JSON 쪽 개수만큼) 건너뛴다. 한 파일 안에서 이름과 날짜가 같은 일정은 모두 유지한다.
+    """
+    store = SqliteStore(db_path)
+    try:
+        if store.conn.execute("SELECT 1 FROM events LIMIT 1").fetchone():
+            return 0
+
+        events = JsonJournalStore(json_path).load() if os.path.exists(json_path) else []
+        events += _new_csv_events(events, CsvStore(csv_path).load())
+
+        if not store.compact(events):
+            return 0
+        return len(events)
+    finally:
+        store.close()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 실행 구간(span) 시간 기록
+# - 환경 변수 DDAY_TRACE=<파일> 을 지정하고 실행하면 구간별 시간을 모아
+#   프로그램이 끝날 때 파일로 저장한다.
+#     *.json : Chrome trace event 형식 (chrome://tracing, Perfetto 에서 열기)
+#     그 외  : collapsed stack 형식 ("a;b;c <마이크로초>", flamegraph.pl / speedscope 용)
+# - 꺼져 있으면 traced 는 함수를 그대로 돌려주고 span 은 아무 일도 하지 않는
+#   공용 객체를 돌려주므로 비용이 거의 없다. 환경 변수는 import 할 때 한 번만 읽는다.
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+TRACE_FILE = os.environ.get('DDAY_TRACE') or None
+ENABLED = TRACE_FILE is not None
+
+# 끝난 구간: (스레드 id, 이름, 시작(초), 길이(초), 자기 시간(초), 스택 경로, 인자)
+_records = []
+# 순간 이벤트: (스레드 id, 이름, 시각(초), 인자)
+_marks = []
+_lock = threading.Lock()
+_local = threading.local()
+_origin = time.perf_counter()
+
+
+class _NullSpan:
+    """추적이 꺼져 있을 때 쓰는 아무 일도 하지 않는 구간"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _stack():
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start', 'child_time')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+        self.child_time = 0.0
+
+    def __enter__(self):
+        _stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        stack = _stack()
+        path = ';'.join(span.name for span in stack)
+        stack.pop()
+        if stack:
+            stack[-1].child_time += duration
+        record = (threading.get_ident(), self.name, self.start - _origin, duration,
+                  duration - self.child_time, path, self.args)
+        with _lock:
+            _records.append(record)
+        return False
+
+
+def span(name, **args):
+    """with span("이름"): ... 로 구간 시간 기록"""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name=None):
+    """함수 호출 전체를 구간으로 기록하는 데코레이터 (꺼져 있으면 함수를 그대로 반환)"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(span_name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def mark(name, **args):
+    """순간 이벤트 기록 (예전 디버깅용 print 대신 사용)"""
+    if not ENABLED:
+        return
+    with _lock:
+        _marks.append((threading.get_ident(), name, time.perf_counter() - _origin, args))
+
+
+def _chrome_trace():
+    pid = os.getpid()
+    events = []
+    for tid, name, start, duration, _, _, args in _records:
+        event = {'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6, 'pid': pid, 'tid': tid}
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        events.append(event)
+    for tid, name, at, args in _marks:
+        event = {'name': name, 'ph': 'i', 's': 't', 'ts': at * 1e6, 'pid': pid, 'tid': tid}
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        events.append(event)
+    events.sort(key=lambda event: event['ts'])
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def _collapsed_stacks():
+    totals = {}
+    for _, _, _, _, self_time, path, _ in _records:
+        totals[path] = totals.get(path, 0.0) + self_time
+    return ''.join(f"{path} {max(1, round(total * 1e6))}\n" for path, total in sorted(totals.items()))
+
+
+def write(path=None):
+    """모은 기록을 파일로 저장 (확장자가 .json 이면 Chrome trace, 그 외 collapsed stack)"""
+    path = path or TRACE_FILE
+    if not path:
+        return False
+    with _lock:
+        try:
+            if path.lower().endswith('.json'):
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(_chrome_trace(), f, ensure_ascii=False)
+            else:
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(_collapsed_stacks())
+        except IOError as e:
+            print(f"Error writing trace: {e}")
+            return False
+    return True
+
+
+if ENABLED:
+    atexit.register(write)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 화면 갱신 묶음 처리
+# - 사용자 동작 하나(이벤트 핸들러)가 page.update() 를 여러 번 부르면
+#   매번 전체 페이지를 비교해 클라이언트로 보낸다.
+# - UpdateBatcher 는 with 블록 안에서 들어온 갱신 요청을 모아 두었다가
+#   블록이 끝날 때 바뀐 컨트롤만 page.update(*controls) 로 한 번에 보낸다.
+#   컨트롤 없이 요청하면 (페이지 속성 변경 등) 페이지 전체를 한 번 갱신한다.
+# - flet 에 의존하지 않으며 update(*controls) 를 가진 객체면 무엇이든 쓸 수 있다.
+
+import threading
+
+from .tracing import mark
+
+
+class UpdateBatcher:
+    """갱신 요청을 모아 한 번의 page.update() 로 보내는 객체
+
+    flet 의 동기 이벤트 핸들러는 여러 스레드에서 실행될 수 있으므로
+    묶음 상태는 스레드마다 따로 유지한다.
+
+    requests    : 지금까지 들어온 갱신 요청 수 (묶지 않았다면 왕복 횟수)
+    round_trips : 실제로 page.update() 를 호출한 횟수
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.requests = 0
+        self.round_trips = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _state(self):
+        state = self._local
+        if not hasattr(state, 'depth'):
+            state.depth = 0
+            state.full = False
+            state.dirty = []
+        return state
+
+    def request(self, *controls):
+        """갱신 요청 (컨트롤이 없으면 페이지 전체)
+
+        묶음 밖에서 호출되면 바로 전송한다.
+        """
+        with self._lock:
+            self.requests += 1
+        state = self._state()
+        if state.depth == 0:
+            self._send(not controls, controls)
+            return
+        if not controls:
+            state.full = True
+            return
+        for control in controls:
+            if not any(control is dirty for dirty in state.dirty):
+                state.dirty.append(control)
+
+    def __enter__(self):
+        self._state().depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        state = self._state()
+        state.depth -= 1
+        # 가장 바깥 묶음이 끝날 때만 전송 (예외가 나도 바뀐 화면은 보냄)
+        if state.depth == 0:
+            self.flush()
+        return False
+
+    def flush(self):
+        """모아 둔 갱신을 한 번에 전송"""
+        state = self._state()
+        full, dirty = state.full, state.dirty
+        state.full = False
+        state.dirty = []
+        if full or dirty:
+            self._send(full, dirty)
+
+    def _send(self, full, controls):
+        with self._lock:
+            self.round_trips += 1
+        mark("page.update", controls="page" if full else len(controls))
+        if full:
+            self.page.update()
+        else:
+            self.page.update(*controls)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# D-Day 관리자의 8주 주간 진행 바 계산
+# - 오늘 기준 앞뒤 4주(9칸 중 가운데 칸은 구분선)를 보여주고, 일정이 그 범위를
+#   벗어나면 일정 날짜 쪽으로 구간을 옮긴다.
+# - 날짜 서수의 뺄셈/나눗셈만으로 각 주의 상태를 구하며, 같은
+#   (일정이 들어가는 칸, 오늘이 들어가는 칸) 조합은 같은 결과 튜플을 공유한다.
+
+from functools import lru_cache
+
+# 구간 전체 칸 수 (8주 + 가운데 구분선)
+SLOTS = 9
+# 구분선 칸
+SEPARATOR_SLOT = 4
+# 오늘 기준 앞뒤로 보여주는 일수 (4주)
+HALF_SPAN = 28
+
+# 주 상태
+FUTURE = 0  # 다가올 주
+PAST = 1  # 지난 주 (시작일이 오늘 이전)
+TODAY = 2  # 오늘이 들어 있는 주
+TARGET = 3  # 일정 날짜가 들어 있는 주
+
+
+def strip_start(target_ordinal, today_ordinal):
+    """주간 진행 바 첫 칸의 시작일 서수"""
+    start = today_ordinal - HALF_SPAN
+    end = today_ordinal + HALF_SPAN
+    if target_ordinal < start:
+        # 이미 지난 D-Day: 일정 날짜부터 시작
+        if (start - target_ordinal) // 7 > 0:
+            start = target_ordinal
+    elif target_ordinal > end:
+        # 먼 미래의 D-Day: 일정 날짜에서 끝나도록
+        if (target_ordinal - end) // 7 > 0:
+            start = target_ordinal - 2 * HALF_SPAN
+    return start
+
+
+def _slot(ordinal, start):
+    """ordinal 이 들어가는 칸 번호, 구간 밖이면 -1"""
+    offset = ordinal - start
+    if 0 <= offset < SLOTS * 7:
+        return offset // 7
+    return -1
+
+
+@lru_cache(maxsize=None)
+def _states(target_slot, today_slot, past_slot):
+    states = []
+    for slot in range(SLOTS):
+        if slot == SEPARATOR_SLOT:
+            continue
+        if slot == target_slot:
+            states.append(TARGET)
+        elif slot == today_slot:
+            states.append(TODAY)
+        elif slot <= past_slot:
+            states.append(PAST)
+        else:
+            states.append(FUTURE)
+    return tuple(states)
+
+
+def week_states(target_ordinal, today_ordinal):
+    """구분선을 뺀 8개 주의 상태 튜플"""
+    start = strip_start(target_ordinal, today_ordinal)
+    # 시작일이 오늘 이전인 마지막 칸 (없으면 -1)
+    past_slot = min((today_ordinal - start) // 7, SLOTS - 1) if today_ordinal >= start else -1
+    return _states(_slot(target_ordinal, start), _slot(today_ordinal, start), past_slot)
+
+
+def week_state_matrix(target_ordinals, today_ordinal):
+    """여러 일정의 주 상태를 한 번에 계산 (일정 순서대로 상태 튜플 목록)"""
+    return [week_states(target, today_ordinal) for target in target_ordinals]
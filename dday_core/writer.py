@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 AidALL Inc. All rights reserved.
+
+# 지연 쓰기(write-behind) 저장 스레드
+# - UI 이벤트 핸들러는 변경 사항만 등록하고 바로 돌아간다.
+# - 백그라운드 스레드가 delay 초 동안 들어온 변경을 일정 id 별로 합쳐서
+#   저장소에 한 번에 기록한다 (같은 일정을 여러 번 고쳐도 한 번만 씀).
+# - 결과는 on_result(성공 여부, 메시지) 콜백으로 비동기 보고한다.
+# - 기록에 실패한 변경은 버리지 않고 다시 대기열에 넣어 RETRY_DELAY 초 뒤에 재시도한다.
+#   실패는 연속된 실패마다 한 번만 알리고, 재시도에 성공하면 원래 메시지를 알린다.
+# - 저장소에는 일정의 사본을 넘기고, 저장소가 다른 프로그램의 일정과 겹친 id 를
+#   바꾼 경우 on_renumber(일정, 새 id) 로 알린다.
+
+import threading
+import time
+
+from .tracing import span
+
+# 변경을 모으는 기본 시간(초)
+DEFAULT_DELAY = 0.5
+
+# 기록에 실패한 뒤 다시 시도하기까지 기다리는 시간(초)
+RETRY_DELAY = 2.0
+
+SAVE_ERROR_MESSAGE = "일정 저장 중 오류가 발생했습니다"
+
+
+class WriteBehindWriter:
+    """변경 사항을 모아 백그라운드에서 저장하는 쓰기 스레드
+
+    store    : EventStore (write_batch / compact 사용)
+    snapshot : 저장소가 compact 를 필요로 할 때 전체 일정을 돌려주는 함수
+    delay    : 변경을 모으는 시간(초)
+    on_result: 기록이 끝날 때마다 쓰기 스레드에서 on_result(ok, message) 호출 (연속된 실패는 처음 한 번만)
+    on_renumber: 저장소가 일정에 새 id 를 발급하면 쓰기 스레드에서 on_renumber(event, new_id) 호출
+                 (호출한 쪽이 event.id 를 바꾸고 색인을 갱신해야 함)
+    """
+
+    def __init__(self, store, snapshot, delay=DEFAULT_DELAY, on_result=None, on_renumber=None):
+        self.store = store
+        self.snapshot = snapshot
+        self.delay = delay
+        self.on_result = on_result
+        self.on_renumber = on_renumber
+
+        # 일정 id → 저장할 Event (삭제는 None)
+        self._pending = {}
+        self._message = None
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        # 다음 재시도 시각 (monotonic, 마지막 기록이 실패했을 때만 설정)
+        self._retry_at = None
+        # 저장소가 바꾼 id (예전 id → 새 id), 바뀌기 전에 등록된 삭제에 사용
+        self._renamed = {}
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="dday-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, event, message=None):
+        """일정 추가/수정 등록 (실제 기록 시점의 일정 내용이 저장됨)"""
+        self._enqueue(event.id, event, message)
+
+    def delete(self, event_id, message=None):
+        """일정 삭제 등록"""
+        self._enqueue(event_id, None, message)
+
+    def _enqueue(self, event_id, event, message):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("writer is closed")
+            self._pending[event_id] = event
+            if message is not None:
+                self._message = message
+            self._cond.notify_all()
+
+    def flush(self):
+        """등록된 변경을 기다리지 않고 바로 기록하고 끝날 때까지 대기, 남은 변경이 없으면 True
+
+        기록에 실패했거나 재시도를 기다리는 중이면 변경을 대기열에 남겨 둔 채 False 를 돌려준다.
+        """
+        with self._cond:
+            if self._pending and self._retry_at is None and not self._closed:
+                self._flush_requested = True
+                self._cond.notify_all()
+            while self._flush_requested or self._writing:
+                self._cond.wait()
+            return not self._pending
+
+    def close(self):
+        """남은 변경을 모두 기록하고 스레드 종료 (여러 번 호출해도 됨)"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                # 첫 변경 이후 delay 초 동안 들어오는 변경을 함께 모음
+                # (실패한 뒤라면 재시도 시각까지 기다림)
+                deadline = time.monotonic() + self.delay
+                if self._retry_at is not None:
+                    deadline = max(deadline, self._retry_at)
+                while not self._closed and not self._flush_requested:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch, self._pending = self._pending, {}
+                message, self._message = self._message, None
+                self._flush_requested = False
+                self._writing = True
+
+            ok = self._write(batch)
+
+            with self._cond:
+                self._writing = False
+                # 이미 실패한 상태에서 또 실패하면 다시 알리지 않음
+                report = ok or self._retry_at is None
+                if ok:
+                    self._retry_at = None
+                else:
+                    self._retry_at = time.monotonic() + RETRY_DELAY
+                    # 실패한 변경을 되돌려 놓되, 그 사이 같은 일정에 새로 들어온 변경은 유지
+                    for event_id, event in batch.items():
+                        self._pending.setdefault(event_id, event)
+                    # 메시지도 재시도에 성공했을 때 알리도록 남겨 둠 (그 사이 새 메시지가 있으면 그쪽)
+                    if self._message is None:
+                        self._message = message
+                self._cond.notify_all()
+                # 종료 중 마지막 기록까지 실패하면 더 기다리지 않음
+                give_up = not ok and self._closed
+
+            if report and self.on_result is not None:
+                try:
+                    self.on_result(ok, message if ok else SAVE_ERROR_MESSAGE)
+                except Exception as e:
+                    print(f"Error reporting save result: {e}")
+
+            if give_up:
+                print(f"Error saving data: {len(self._pending)} change(s) could not be written")
+                return
+
+    def _write(self, batch):
+        originals = [event for event in batch.values() if event is not None]
+        # 저장소가 id 를 바꿀 수 있으므로 사본을 넘기고, 바뀐 id 는 on_renumber 로 반영
+        events = [event.copy() for event in originals]
+        deleted_ids = [self._renamed.get(event_id, event_id) for event_id, event in batch.items() if event is None]
+        try:
+            with span("writer.write_batch", events=len(events), deleted=len(deleted_ids)):
+                ok = self.store.write_batch(events, deleted_ids)
+            if ok:
+                self._apply_renumbers(originals, events)
+            if ok and self.store.needs_compaction:
+                with span("writer.compact"):
+                    ok = self.store.compact(self.snapshot())
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+        return ok
+
+    def _apply_renumbers(self, originals, written):
+        for original, event in zip(originals, written):
+            if event.id == original.id:
+                continue
+            self._renamed[original.id] = event.id
+            if self.on_renumber is None:
+                original.id = event.id
+                continue
+            try:
+                self.on_renumber(original, event.id)
+            except Exception as e:
+                print(f"Error reporting renumbered event: {e}")
@@ -11,135 +11,183 @@
 
 # 의존성 설치: pip install -r requirements.txt
 
-import flet as ft
+import atexit
 import datetime
-import json
+import functools
 import os
-import calendar
-
-# Flet 버전 확인 - 예외 처리 추가
-try:
-    import pkg_resources
-    flet_version = pkg_resources.get_distribution("flet").version
-    print(f"Flet version: {flet_version}")
-except Exception as e:
-    print(f"Flet 버전을 확인할 수 없습니다: {e}")
-    flet_version = "unknown"
-
-# DatePicker 지원 확인
-print("Checking DatePicker support...")
-try:
-    datepicker_class = ft.DatePicker
-    print(f"DatePicker class exists: {datepicker_class}")
-    print(f"DatePicker attributes: {[attr for attr in dir(datepicker_class) if not attr.startswith('_')]}")
-except Exception as e:
-    print(f"DatePicker not supported: {e}")
-
-DATA_FILE = 'dday_data.json'
-
-def parse_date(date_input):
-    """다양한 형식의 날짜 문자열을 파싱하여 YYYY-MM-DD 형식으로 반환"""
-    date_input = date_input.strip()
-    
-    # 이미 YYYY-MM-DD 형식이면 그대로 반환
-    if len(date_input) == 10 and date_input[4] == '-' and date_input[7] == '-':
-        try:
-            datetime.datetime.strptime(date_input, "%Y-%m-%d")
-            return date_input
-        except ValueError:
-            pass
-    
-    # YYYY.MM.DD 형식
-    if len(date_input) == 10 and date_input[4] == '.' and date_input[7] == '.':
-        try:
-            date_obj = datetime.datetime.strptime(date_input, "%Y.%m.%d")
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            pass
-    
-    # YYYYMMDD 형식 (숫자 8자리)
-    if len(date_input) == 8 and date_input.isdigit():
-        try:
-            date_obj = datetime.datetime.strptime(date_input, "%Y%m%d")
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            pass
-    
-    # 다른 일반적인 날짜 형식도 시도
-    for fmt in ["%Y/%m/%d", "%d-%m-%Y", "%d.%m.%Y", "%m/%d/%Y"]:
-        try:
-            date_obj = datetime.datetime.strptime(date_input, fmt)
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-            
-    # 파싱 실패 시 None 반환
-    return None
+import threading
+
+from dday_core.dates import format_dday, parse_date
+from dday_core.event import Event
+from dday_core.gradient import gradient_png_base64, progress_bucket
+from dday_core.index import EventIndex
+from dday_core.lazy import lazy_import
+from dday_core.progress import ProgressEngine
+from dday_core.storage import DEFAULT_DATA_FILE, PagedEvents, merge_legacy_csv, open_store
+from dday_core.tracing import ENABLED as TRACING, mark, traced
+from dday_core.updates import UpdateBatcher
+from dday_core.writer import DEFAULT_DELAY, WriteBehindWriter
 
-def calculate_dday(date_str):
-    """Calculates D-Day string from a date string (YYYY-MM-DD)."""
+# flet 은 화면을 만들 때 처음 import (핵심 로직만 쓰는 경우 import 비용 없음)
+ft = lazy_import('flet')
+# 연간 진행률 실시간 갱신 작업에서만 사용
+asyncio = lazy_import('asyncio')
+
+# DDAY_DIAGNOSTICS=1 이면 시작할 때 flet 버전 등 진단 정보를 출력
+DIAGNOSTICS = os.environ.get('DDAY_DIAGNOSTICS', '') not in ('', '0')
+
+# DatePicker 지원 여부 (처음 달력을 열 때 확인)
+_date_picker_supported = None
+
+
+def get_flet_version():
+    """설치된 flet 버전 (확인할 수 없으면 "unknown")"""
     try:
-        target_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-        today = datetime.date.today()
-        delta = target_date - today
-        days = delta.days
-        if days == 0:
-            return "D-Day"
-        elif days > 0:
-            return f"D-{days}"
-        else:
-            return f"D+{abs(days)}"
-    except ValueError:
-        return "날짜 오류" # Error with date format
+        from importlib.metadata import version
+        return version("flet")
+    except Exception as e:
+        print(f"Flet 버전을 확인할 수 없습니다: {e}")
+        return "unknown"
 
-def load_data():
-    """Loads D-Day data from the JSON file."""
-    if os.path.exists(DATA_FILE):
+
+def date_picker_supported():
+    """flet 에 DatePicker 가 있는지 (결과는 캐시)"""
+    global _date_picker_supported
+    if _date_picker_supported is None:
         try:
-            with open(DATA_FILE, 'r', encoding='utf-8') as f:
-                # Ensure loaded data is a list of dictionaries
-                data = json.load(f)
-                if isinstance(data, list) and all(isinstance(item, dict) for item in data):
-                    return data
-                else:
-                    print("Warning: Data file does not contain a valid list of events. Starting fresh.")
-                    return []
-        except (IOError, json.JSONDecodeError) as e:
-            print(f"Error loading data: {e}") # Print error to console
-            return [] # Return empty list on error
-    return [] # Return empty list if file doesn't exist
+            datepicker_class = ft.DatePicker
+            _date_picker_supported = True
+            if DIAGNOSTICS:
+                print(f"DatePicker attributes: {[attr for attr in dir(datepicker_class) if not attr.startswith('_')]}")
+        except Exception as e:
+            print(f"DatePicker not supported: {e}")
+            _date_picker_supported = False
+    return _date_picker_supported
+
+# 저장 파일 (.db/.sqlite 확장자면 sqlite 저장소, 그 외에는 JSON 저널 저장소)
+# sqlite 저장소는 전체 일정을 읽지 않고 표에 보일 만큼만 날짜/이름 색인으로 조회
+# 지정하지 않으면 tkinter 앱과 같은 기본 파일을 함께 사용
+DATA_FILE = os.environ.get('DDAY_DATA_FILE', DEFAULT_DATA_FILE)
 
+# 테이블에 한 번에 만드는 행 수 / 스크롤 끝에서 이만큼(px) 남으면 다음 행을 불러옴
+ROW_PAGE_SIZE = 100
+SCROLL_LOAD_THRESHOLD = 300
+
+# 연간 진행률 바 크기(px)
+PROGRESS_BAR_WIDTH = 650
+PROGRESS_BAR_HEIGHT = 30
+
+# 연간 진행률 계산 시간대 (예: Asia/Seoul, 지정하지 않으면 로컬 시간)
+TIMEZONE = os.environ.get('DDAY_TIMEZONE') or None
+
+# 진행률 소수점 자릿수 (기본 6자리: 올해 지난 시간이 초 단위로 보여 약 0.3초마다 바뀜)
+# 1 로 두면 tkinter 앱과 같이 0.1% 단위로 표시 (진행률 바는 항상 0.1% 단위로 바뀜)
+PROGRESS_DECIMALS = int(os.environ.get('DDAY_PROGRESS_DECIMALS', '6'))
+# 연간 진행률 화면이 보이는 동안 값을 다시 계산하는 최대 간격(초)
+# 평소에는 표시 값이 바뀌는 시각까지 기다리고, 절전이나 시계 변경에 대비해 이 간격마다는 확인
+PROGRESS_TICK = float(os.environ.get('DDAY_PROGRESS_TICK', '60'))
+# 표시 값이 바뀌는 시각 직후 값이 확실히 바뀐 뒤에 깨어나도록 두는 여유 시간(초)
+PROGRESS_TICK_MARGIN = 0.05
+
+# 변경 사항을 모아서 저장하기까지 기다리는 시간(초)
+SAVE_DELAY = float(os.environ.get('DDAY_SAVE_DELAY', DEFAULT_DELAY))
+
+# DATA_FILE 에 대한 저장소
+_store = None
+
+def get_store():
+    """DATA_FILE 에 맞는 저장소 반환"""
+    global _store
+    if _store is None or _store.path != DATA_FILE:
+        if _store is not None:
+            _store.close()
+        _store = open_store(DATA_FILE)
+    return _store
+
+@traced("load_data")
+def load_data():
+    """Loads D-Day data from the configured store."""
+    return get_store().load()
+
+@traced("save_data")
 def save_data(data):
-    """Saves D-Day data to the JSON file."""
-    try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        return True
-    except IOError as e:
-        print(f"Error saving data: {e}") # Print error to console
-        return False
+    """Saves all D-Day data to the configured store at once."""
+    return get_store().compact(data)
+
+
+def batched(handler):
+    """핸들러 안에서 요청된 화면 갱신을 모아 끝날 때 한 번만 전송"""
+    @functools.wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        with self.updates:
+            return handler(self, *args, **kwargs)
+    return wrapper
 
 
 class DDayManager:
-    def __init__(self, page: ft.Page):
+    def __init__(self, page):
         self.page = page
+        # DDAY_TRACE 가 설정된 경우 page.update() 왕복 시간도 기록
+        if TRACING:
+            self.page.update = traced("page.update")(self.page.update)
+        # 사용자 동작 하나에서 생긴 갱신 요청을 모아 보내는 객체 (왕복 횟수도 셈)
+        self.updates = UpdateBatcher(self.page)
         
         # 제거: 페이지 속성 설정(window_width, window_height)은 main 함수에서만 처리
         self.page.title = "째깍째깍째깍째깍 feat. 똥방구쟁이"
         self.page.vertical_alignment = ft.MainAxisAlignment.START
         
         # 데이터 및 상태 관리
-        self.events = load_data()
+        # 구간 조회를 지원하는 저장소(sqlite)면 표에 보일 일정만 그때그때 조회
+        store = get_store()
+        self.query_store = store if store.supports_range_queries else None
+        # id 색인과 날짜순/이름순 정렬 목록을 유지하는 일정 모음
+        # (조회 모드에서는 지금까지 읽은 일정과 새로 만든 일정만 들어 있음)
+        if self.query_store is not None:
+            self.query_store.reserve_ids()
+            self.event_index = EventIndex()
+        else:
+            self.event_index = EventIndex(load_data())
+        # 현재 정렬 기준과 표시 모드에 맞춰 테이블에 보여줄 일정
+        self.visible_events = []
         self.selected_event_data = None
+        # 현재 선택된 테이블 행 (다른 행 전체를 훑지 않고 선택 해제하기 위해 보관)
+        self.selected_row = None
+        
+        # 일정 id → 테이블 행 / 마지막으로 그린 셀 내용 (행 재사용 및 변경 감지용)
+        self.row_cache = {}
+        self.row_states = {}
+        
+        # 테이블에 실제로 만들어 둔 행 수 (스크롤하면 ROW_PAGE_SIZE 씩 늘어남)
+        self.row_limit = ROW_PAGE_SIZE
         
         # 현재 선택 중인 날짜 필드 저장용
         self.current_date_field = None
         
+        # 일정 색인 변경과 쓰기 스레드의 전체 일정 복사가 겹치지 않게 하는 잠금
+        self.index_lock = threading.Lock()
+        
+        # 지연 쓰기 저장 스레드 (변경을 SAVE_DELAY 초 동안 모아 기록)
+        self.writer = WriteBehindWriter(
+            store,
+            snapshot=self.snapshot_events,
+            delay=SAVE_DELAY,
+            on_result=self.handle_save_result,
+            on_renumber=self.handle_renumber
+        )
+        # 연간 진행률 실시간 갱신 작업 (진행률 화면이 보이는 동안만 실행)
+        self.progress_ticker = None
+        
+        # 세션 종료 및 프로그램 종료 시 남은 변경 기록
+        self.page.on_close = self.handle_close
+        atexit.register(self.close_writer)
+        
         # 현재/지나간 일정 표시 모드
         self.show_past_events = False
         
-        # 연간 진행률 화면 표시 상태
+        # 연간 진행률 화면 표시 상태 / 진행률 계산기 (올해 시작/끝 시각 캐시)
         self.show_year_progress = False
+        self.progress_engine = ProgressEngine(TIMEZONE)
 
         # UI 요소 초기화
         self.init_ui()
@@ -344,10 +392,51 @@ class DDayManager:
             expand=False                        # 자동 확장 비활성화
         )
 
+        # 남은 행 더 보기 버튼 (스크롤이 끝에 닿아도 자동으로 더 불러옴)
+        self.load_more_btn = ft.TextButton(
+            text="더 보기",
+            on_click=self.load_more_rows,
+            visible=False
+        )
+
         # 연간 진행률 컨테이너
         self.year_progress_container = self.create_year_progress_ui()
         self.year_progress_container.visible = False
 
+        # 일정 화면 (왼쪽 테이블 + 오른쪽 폼, 연간 진행률 화면과 번갈아 표시)
+        self.schedule_view = ft.Row(
+            [
+                # 왼쪽: 이벤트 테이블
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            self.events_table,
+                            self.load_more_btn
+                        ],
+                        spacing=5,
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    ),
+                    expand=True,
+                ),
+                # 오른쪽: 폼 영역
+                ft.Container(
+                    content=ft.Column(
+                        [
+                            self.add_form,
+                            self.edit_form
+                        ],
+                        spacing=10,
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER
+                    ),
+                    width=250,
+                    padding=10,
+                    alignment=ft.alignment.top_center
+                )
+            ],
+            expand=True,
+            vertical_alignment=ft.CrossAxisAlignment.START
+        )
+
         # 메인 레이아웃 구성
         self.page.add(
             ft.Column(
@@ -360,36 +449,14 @@ class DDayManager:
                         self.edit_button, 
                         self.delete_button
                     ], alignment=ft.MainAxisAlignment.START, spacing=10, height=65),
-                    ft.Row(
-                        [
-                            # 왼쪽: 이벤트 테이블
-                            ft.Container(
-                                content=self.events_table,
-                                expand=True,
-                            ),
-                            # 오른쪽: 폼 영역
-                            ft.Container(
-                                content=ft.Column(
-                                    [
-                                        self.add_form,
-                                        self.edit_form
-                                    ],
-                                    spacing=10,
-                                    horizontal_alignment=ft.CrossAxisAlignment.CENTER
-                                ),
-                                width=250,
-                                padding=10,
-                                alignment=ft.alignment.top_center
-                            )
-                        ],
-                        expand=True,
-                        vertical_alignment=ft.CrossAxisAlignment.START
-                    ),
+                    self.schedule_view,
                     # 연간 진행률 컨테이너 추가
                     self.year_progress_container
                 ],
                 expand=True,
-                scroll=ft.ScrollMode.AUTO
+                scroll=ft.ScrollMode.AUTO,
+                on_scroll=self.handle_scroll,
+                on_scroll_interval=100
             )
         )
 
@@ -408,15 +475,15 @@ class DDayManager:
         self.edit_form.visible = False
         
         # 초기화 전에 UI 업데이트하여 폼이 사라지도록
-        self.page.update()
+        self.updates.request(self.add_form, self.edit_form)
         
         if is_visible:
             # 폼 초기화 및 표시
-            name_field.value = initial_values['name'] if initial_values else ""
+            name_field.value = initial_values.name if initial_values else ""
             
             # 날짜 필드 직접 참조
             date_field = date_row.controls[0]
-            date_field.value = initial_values['date'] if initial_values else ""
+            date_field.value = initial_values.date if initial_values else ""
             
             name_field.error_text = None
             date_field.error_text = None
@@ -433,13 +500,14 @@ class DDayManager:
         form.visible = is_visible
         
         # UI 업데이트
-        self.page.update()
+        self.updates.request(form)
         
         # 로그 출력
         action = "opened" if is_visible else "closed"
         form_name = "Add form" if form == self.add_form else "Edit form"
         print(f"{form_name} {action}")
 
+    @batched
     def show_add_form(self, e):
         """일정 추가 폼 표시"""
         print("show_add_form called")  # 디버깅용 로그
@@ -451,6 +519,7 @@ class DDayManager:
             True
         )
 
+    @batched
     def cancel_add_form(self, e):
         """일정 추가 폼 취소"""
         print("cancel_add_form called")  # 디버깅용 로그
@@ -487,38 +556,32 @@ class DDayManager:
         # 입력값 검증
         if not name:
             name_field.error_text = "일정 이름을 입력하세요"
-            self.page.update()
+            self.updates.request(name_field)
             return None, None
         
         if not date_input:
             date_field.error_text = "날짜를 입력하세요"
-            self.page.update()
+            self.updates.request(date_field)
             return None, None
 
         # 날짜 형식 검증 - 다양한 형식 지원
         formatted_date = parse_date(date_input)
         if not formatted_date:
             date_field.error_text = "인식할 수 없는 날짜 형식입니다"
-            self.page.update()
+            self.updates.request(date_field)
             return None, None
             
         return name, formatted_date
 
+    @batched
     def save_new_event(self, e):
         """새 일정 저장"""
-        print("save_new_event called")  # 디버깅용 로그
-        print(f"Event parameter: {e}")
-        print(f"Event type: {type(e)}")
-        
-        # new_event_date_str 참조 확인
-        print(f"new_event_date_str: {self.new_event_date_str}")
+        mark("save_new_event", has_date_field=self.new_event_date_str is not None)
         
         # 날짜 필드가 None인 경우 직접 가져오기
         if self.new_event_date_str is None:
-            print("직접 날짜 필드 참조 시도")
             try:
                 self.new_event_date_str = self.new_date_row.controls[0]
-                print(f"날짜 필드 가져옴: {self.new_event_date_str}")
             except Exception as ex:
                 print(f"날짜 필드 가져오기 실패: {ex}")
         
@@ -526,22 +589,17 @@ class DDayManager:
             # 데이터 유효성 검사
             name, formatted_date = self.validate_event_data(self.new_event_name, self.new_event_date_str)
             if not name or not formatted_date:
-                print("유효성 검사 실패")
+                mark("save_new_event.invalid")
                 return
                 
             # 이벤트 추가
-            new_event = {'name': name, 'date': formatted_date}
-            self.events.append(new_event)
-            print(f"Event added: {new_event}")  # 디버깅용 로그
+            new_event = Event(name, formatted_date)
+            with self.index_lock:
+                self.event_index.add(new_event)
+            mark("save_new_event.added", id=new_event.id)
             
-            # 데이터 저장
-            save_result = save_data(self.events)
-            print(f"Save result: {save_result}")  # 디버깅용 로그
-            
-            if save_result:
-                self.show_snackbar("일정이 추가되었습니다")
-            else:
-                self.show_snackbar("일정 저장 중 오류가 발생했습니다", ft.Colors.RED)
+            # 데이터 저장 (백그라운드에서 기록 후 결과를 스낵바로 표시)
+            self.writer.put(new_event, "일정이 추가되었습니다")
             
             # 테이블 업데이트
             self.sort_and_populate()
@@ -554,6 +612,7 @@ class DDayManager:
             print(traceback.format_exc())  # 스택 트레이스 출력
             self.show_snackbar(f"일정 저장 중 문제가 발생했습니다: {str(ex)}", ft.Colors.RED)
 
+    @batched
     def show_edit_form(self, e):
         """일정 수정 폼 표시"""
         if self.selected_event_data:
@@ -568,6 +627,7 @@ class DDayManager:
         else:
             self.show_snackbar("수정할 일정을 선택해주세요", ft.Colors.AMBER)
 
+    @batched
     def cancel_edit_form(self, e):
         """일정 수정 폼 취소"""
         print("cancel_edit_form called")  # 디버깅용 로그
@@ -579,6 +639,7 @@ class DDayManager:
             False
         )
 
+    @batched
     def update_event(self, e):
         """일정 수정"""
         if self.selected_event_data:
@@ -591,15 +652,12 @@ class DDayManager:
             if not name or not formatted_date:
                 return
                 
-            # 이벤트 업데이트
-            self.selected_event_data['name'] = name
-            self.selected_event_data['date'] = formatted_date
+            # 이벤트 업데이트 (날짜가 바뀐 경우에만 서수가 다시 계산됨)
+            with self.index_lock:
+                self.event_index.update(self.selected_event_data, name, formatted_date)
             
-            # 데이터 저장
-            if save_data(self.events):
-                self.show_snackbar("일정이 수정되었습니다")
-            else:
-                self.show_snackbar("일정 수정 중 오류가 발생했습니다", ft.Colors.RED)
+            # 데이터 저장 (백그라운드에서 기록 후 결과를 스낵바로 표시)
+            self.writer.put(self.selected_event_data, "일정이 수정되었습니다")
             
             # 테이블 업데이트
             self.sort_and_populate()
@@ -609,38 +667,33 @@ class DDayManager:
         else:
             self.show_snackbar("수정할 일정을 선택해주세요", ft.Colors.AMBER)
 
+    @batched
     def open_delete_dialog(self, e):
         """삭제 기능 - 직접 삭제 구현"""
-        print("삭제 버튼 클릭됨")
+        mark("open_delete_dialog", selected=self.selected_event_data is not None)
         if self.selected_event_data:
-            event_name = self.selected_event_data.get('name', '')
-            event_date = self.selected_event_data.get('date', '')
-            print(f"선택된 일정: {event_name} ({event_date})")
+            event_name = self.selected_event_data.name
             
             # 직접 삭제 수행
             try:
                 # 이벤트 목록에서 선택된 이벤트 제거
-                self.events.remove(self.selected_event_data)
-                print(f"목록에서 '{event_name}' 제거 성공")
-                
-                # 데이터 저장
-                save_result = save_data(self.events)
-                print(f"데이터 저장 결과: {save_result}")
+                deleted_event = self.selected_event_data
+                with self.index_lock:
+                    self.event_index.remove(deleted_event)
+                mark("open_delete_dialog.removed", id=deleted_event.id)
                 
-                if save_result:
-                    self.show_snackbar(f"'{event_name}' 일정이 삭제되었습니다")
-                else:
-                    self.show_snackbar("일정 저장 중 오류가 발생했습니다", ft.Colors.RED)
+                # 데이터 저장 (백그라운드에서 기록 후 결과를 스낵바로 표시)
+                self.writer.delete(deleted_event.id, f"'{event_name}' 일정이 삭제되었습니다")
                 
                 # 선택 상태 초기화
                 self.selected_event_data = None
+                self.selected_row = None
                 self.edit_button.disabled = True
                 self.delete_button.disabled = True
                 
                 # 테이블 새로고침
                 self.sort_and_populate()
-                print("데이터 삭제 완료 및 UI 업데이트됨")
-            except ValueError:
+            except (KeyError, ValueError):
                 print(f"목록에서 일정을 찾을 수 없음")
                 self.show_snackbar("선택한 일정을 찾을 수 없습니다", ft.Colors.RED)
             except Exception as ex:
@@ -649,46 +702,73 @@ class DDayManager:
                 print(traceback.format_exc())
                 self.show_snackbar(f"삭제 중 오류: {str(ex)}", ft.Colors.RED)
         else:
-            print("선택된 일정이 없음")
             self.show_snackbar("삭제할 일정을 선택해주세요", ft.Colors.AMBER)
 
+    def handle_save_result(self, ok, message):
+        """백그라운드 저장 결과 표시 (쓰기 스레드에서 호출됨)"""
+        if message:
+            self.show_snackbar(message, ft.Colors.GREEN if ok else ft.Colors.RED)
+
+    def snapshot_events(self):
+        """compact 에 쓸 전체 일정 사본 (쓰기 스레드에서 호출)
+
+        잠금 안에서 이름/날짜까지 복사하므로 복사 후 UI 에서 일정을 고쳐도
+        반쯤 바뀐 목록이 저장되지 않는다.
+        """
+        with self.index_lock:
+            return [event.copy() for event in self.event_index]
+
+    def handle_renumber(self, event, new_id):
+        """다른 프로그램의 일정과 id 가 겹쳐 새 id 로 기록된 일정을 색인에서 옮김 (쓰기 스레드에서 호출됨)"""
+        with self.index_lock:
+            if self.event_index.get(event.id) is event:
+                self.event_index.renumber(event, new_id)
+            else:
+                event.id = new_id
+        # 행은 일정 id 로 찾으므로 표를 다시 채움
+        self.sort_and_populate()
+
+    def close_writer(self, e=None):
+        """남은 변경을 모두 기록하고 쓰기 스레드 종료 (세션이 끝난 매니저가 남지 않도록 종료 훅도 해제)"""
+        atexit.unregister(self.close_writer)
+        self.writer.close()
+
+    def handle_close(self, e=None):
+        """세션 종료: 진행률 갱신 작업을 멈추고 남은 변경 기록"""
+        self.stop_progress_ticker()
+        self.close_writer()
+
     # --- 테이블 관련 메서드 ---
+    @batched
     def handle_row_select(self, e):
         """행 선택 처리"""
         is_selected = e.data == 'true'
-        row_cells = e.control.cells
-        event_name = row_cells[0].content.value
-        event_date = row_cells[1].content.value
 
         if is_selected:
-            # 선택된 이벤트 데이터 찾기
-            found_event = None
-            for event in self.events:
-                if event.get('name') == event_name and event.get('date') == event_date:
-                    found_event = event
-                    break
-            
-            self.selected_event_data = found_event
+            # 행에 저장된 일정 id 로 이벤트 데이터 찾기
+            self.selected_event_data = self.event_index.get(e.control.data)
             self.delete_button.disabled = False
             self.edit_button.disabled = False
             
-            # 다른 행 선택 해제 및 색상 초기화
-            for row in self.events_table.rows:
-                if row != e.control:
-                    row.selected = False
-                    self.reset_row_colors(row)
-                else:
-                    # 선택된 행 색상 변경
-                    self.highlight_selected_row(row)
+            # 이전에 선택된 행만 선택 해제 및 색상 초기화
+            previous_row = self.selected_row
+            if previous_row is not None and previous_row is not e.control:
+                previous_row.selected = False
+                self.reset_row_colors(previous_row)
+            
+            # 선택된 행 색상 변경
+            self.selected_row = e.control
+            self.highlight_selected_row(e.control)
         else:
             # 선택 해제된 경우
             self.selected_event_data = None
+            self.selected_row = None
             self.delete_button.disabled = True
             self.edit_button.disabled = True
             # 색상 초기화
             self.reset_row_colors(e.control)
 
-        self.page.update()
+        self.updates.request(self.events_table, self.edit_button, self.delete_button)
         
     def highlight_selected_row(self, row):
         """선택된 행 하이라이트"""
@@ -703,6 +783,8 @@ class DDayManager:
     
     def reset_row_colors(self, row):
         """행 색상 초기화"""
+        # 기본 색상과 다르게 칠해질 수 있으므로 다음 갱신 때 셀을 다시 그리도록 함
+        self.row_states.pop(row.data, None)
         for cell in row.cells:
             cell.bgcolor = None
             # 텍스트 스타일 초기화
@@ -716,145 +798,241 @@ class DDayManager:
                 else:
                     cell.content.color = ft.Colors.BLACK
 
+    def create_event_row(self):
+        """일정 행 컨트롤 생성 (내용은 render_event_row 에서 채움)"""
+        return ft.DataRow(
+            cells=[
+                ft.DataCell(ft.Text("", size=14, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS)),
+                ft.DataCell(ft.Text("", size=14, no_wrap=True)),
+                ft.DataCell(ft.Text("", size=14, no_wrap=True)),
+            ],
+            on_select_changed=self.handle_row_select
+        )
+
+    def render_event_row(self, row, event, today):
+        """행의 셀 내용을 일정에 맞게 갱신, 바뀐 셀만 수정하고 변경 여부 반환"""
+        event_ordinal = event.ordinal
+        if event_ordinal is not None:
+            dday_str = format_dday(event_ordinal - today)
+            # D+ 표시인 경우 빨간색으로
+            state = (event.name, event.date, dday_str, None, ft.Colors.RED if event_ordinal < today else ft.Colors.BLACK)
+        else:
+            # 날짜 형식 오류
+            state = (event.name, event.date, "날짜 오류", ft.Colors.RED, ft.Colors.RED)
+
+        previous = self.row_states.get(row.data)
+        if previous == state:
+            return False
+
+        name, date_str, dday_str, date_color, dday_color = state
+        name_text, date_text, dday_text = (cell.content for cell in row.cells)
+        if previous is None or previous[0] != name:
+            name_text.value = name
+        if previous is None or previous[1] != date_str or previous[3] != date_color:
+            date_text.value = date_str
+            date_text.color = date_color
+        if previous is None or previous[2] != dday_str or previous[4] != dday_color:
+            dday_text.value = dday_str
+            dday_text.color = dday_color
+
+        self.row_states[row.data] = state
+        # 선택된 행은 하이라이트 유지
+        if row is self.selected_row:
+            self.highlight_selected_row(row)
+        return True
+
+    @traced("populate_table")
     def populate_table(self):
-        """테이블 데이터 채우기"""
-        self.events_table.rows.clear()
-        current_selection_still_exists = False
-        today = datetime.date.today()
+        """테이블 데이터 채우기
+
+        일정 id 를 키로 기존 행 컨트롤을 재사용하고, 내용이 바뀐 셀만 수정한다.
+        행 목록은 순서가 달라졌을 때만 교체하므로 page.update() 는
+        추가/삭제/변경된 행만 전송한다.
+        표시할 일정 중 앞쪽 row_limit 개만 행으로 만들고 나머지는 스크롤 시 불러온다.
+        """
+        today = self.progress_engine.today().toordinal()
+        previous_rows = self.row_cache
+        self.row_cache = {}
+        new_rows = []
+        selected_row = None
         
-        for event in self.events:
-            # 날짜 파싱
-            try:
-                event_date = datetime.datetime.strptime(event['date'], "%Y-%m-%d").date()
-                # 지나간 일정 여부 확인
-                is_past_event = event_date < today
-                
-                # 현재 표시 모드에 따라 필터링
-                if (self.show_past_events and not is_past_event) or (not self.show_past_events and is_past_event):
-                    continue
-                
-                dday_str = calculate_dday(event['date'])
-                
-                # D+ 표시인 경우 빨간색으로
-                text_color = ft.Colors.RED if "D+" in dday_str else ft.Colors.BLACK
-                
-                row = ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(event['name'], size=14, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS)),
-                        ft.DataCell(ft.Text(event['date'], size=14, no_wrap=True)),
-                        ft.DataCell(ft.Text(dday_str, size=14, color=text_color, no_wrap=True)),
-                    ],
-                    on_select_changed=self.handle_row_select
-                )
-                
-                # 이전에 선택된 행이 있으면 선택 상태 유지
-                if self.selected_event_data == event:
-                    row.selected = True
-                    current_selection_still_exists = True
-                    
-                self.events_table.rows.append(row)
-            except ValueError:
-                # 날짜 형식 오류 - 항상 표시
-                dday_str = "날짜 오류"
-                row = ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(event['name'], size=14, no_wrap=True, overflow=ft.TextOverflow.ELLIPSIS)),
-                        ft.DataCell(ft.Text(event['date'], size=14, color=ft.Colors.RED, no_wrap=True)),
-                        ft.DataCell(ft.Text(dday_str, size=14, color=ft.Colors.RED, no_wrap=True)),
-                    ],
-                    on_select_changed=self.handle_row_select
-                )
-                
-                if not self.show_past_events:  # 현재 일정 모드에서만 표시
-                    if self.selected_event_data == event:
-                        row.selected = True
-                        current_selection_still_exists = True
-                    self.events_table.rows.append(row)
+        for event in self.visible_events[:self.row_limit]:
+            row = previous_rows.pop(event.id, None)
+            if row is None:
+                row = self.create_event_row()
+                row.data = event.id
+            self.render_event_row(row, event, today)
+            
+            # 이전에 선택된 행이 있으면 선택 상태 유지
+            is_selected = self.selected_event_data is event
+            if is_selected:
+                selected_row = row
+            if bool(row.selected) != is_selected:
+                row.selected = is_selected
+                if not is_selected:
+                    self.reset_row_colors(row)
+            
+            self.row_cache[event.id] = row
+            new_rows.append(row)
+
+        # 더 이상 표시되지 않는 행의 상태 정리
+        for event_id in previous_rows:
+            self.row_states.pop(event_id, None)
+
+        # 순서나 구성이 바뀐 경우에만 행 목록 교체
+        rows = self.events_table.rows
+        if len(rows) != len(new_rows) or any(old is not new for old, new in zip(rows, new_rows)):
+            rows[:] = new_rows
 
+        # 아직 만들지 않은 행이 남아 있으면 더 보기 버튼 표시
+        remaining = len(self.visible_events) - len(new_rows)
+        self.load_more_btn.visible = remaining > 0
+        self.load_more_btn.text = f"더 보기 ({remaining}개 남음)"
+
+        self.selected_row = selected_row
         # 선택된 항목이 더 이상 존재하지 않으면 선택 상태 초기화
-        if not current_selection_still_exists and self.selected_event_data is not None:
+        # (아직 행을 만들지 않은 구간에 있는 일정은 선택 유지)
+        selected = self.selected_event_data
+        if selected is not None and selected_row is None and not self.is_event_shown(selected, today):
             self.selected_event_data = None
             self.delete_button.disabled = True
             self.edit_button.disabled = True
 
+    def is_event_shown(self, event, today):
+        """일정이 현재 표시 모드(현재/지나간 일정)에 해당하는지 확인"""
+        if event.id not in self.event_index:
+            return False
+        if event.ordinal is None:
+            # 날짜 형식 오류는 현재 일정 모드에서만 표시
+            return not self.show_past_events
+        return (event.ordinal < today) == self.show_past_events
+
+    @batched
+    def load_more_rows(self, e=None):
+        """다음 ROW_PAGE_SIZE 개의 행을 만들어 테이블에 추가"""
+        if self.row_limit >= len(self.visible_events):
+            return
+        self.row_limit += ROW_PAGE_SIZE
+        self.populate_table()
+        self.updates.request(self.events_table, self.load_more_btn, self.edit_button, self.delete_button)
+
+    def handle_scroll(self, e):
+        """스크롤이 끝부분에 닿으면 다음 행들을 불러옴"""
+        if self.show_year_progress:
+            return
+        if e.pixels >= e.max_scroll_extent - SCROLL_LOAD_THRESHOLD:
+            self.load_more_rows()
+
+    def adopt_events(self, events):
+        """저장소에서 조회한 일정을 색인의 일정 객체로 바꿈
+
+        이미 읽은 일정은 같은 객체를 써서 선택 상태와 행 재사용이 유지되게 하고,
+        처음 읽은 일정은 색인에 추가한다.
+        """
+        adopted = []
+        with self.index_lock:
+            for event in events:
+                existing = self.event_index.get(event.id)
+                if existing is None:
+                    self.event_index.add(event)
+                    existing = event
+                adopted.append(existing)
+        return adopted
+
+    def query_visible_events(self, today):
+        """조회 모드: 현재 표시 모드와 정렬 기준의 일정을 필요한 만큼만 읽는 목록"""
+        # 쓰기 스레드에 남은 변경을 먼저 기록해야 조회 결과에 반영됨
+        self.writer.flush()
+        store = self.query_store
+        if self.show_past_events:
+            by_name = self.past_sort_dropdown.value == "이름순"
+            parts = [(functools.partial(store.past, today, by_name=by_name), functools.partial(store.count_past, today))]
+        else:
+            # 날짜 형식 오류 일정은 하단에 표시
+            by_name = self.sort_dropdown.value == "이름순"
+            parts = [
+                (functools.partial(store.upcoming, today, by_name=by_name), functools.partial(store.count_upcoming, today)),
+                (functools.partial(store.invalid, by_name=by_name), store.count_invalid),
+            ]
+        return PagedEvents(parts, self.adopt_events)
+
+    def closest_upcoming(self, today):
+        """오늘 이후 가장 가까운 일정, 없으면 None"""
+        if self.query_store is not None:
+            self.writer.flush()
+            return self.query_store.closest_upcoming(today)
+        return self.event_index.closest_upcoming(today)
+
+    @batched
+    @traced("sort_and_populate")
     def sort_and_populate(self, e=None):
-        """정렬 기준에 따라 데이터 정렬 및 테이블 업데이트"""
-        today = datetime.date.today()
+        """정렬 기준에 따라 표시할 일정을 고르고 테이블 업데이트
+
+        일정 색인이 날짜순/이름순 목록을 항상 정렬된 상태로 유지하므로
+        여기서는 다시 정렬하지 않고 필요한 구간만 잘라 쓴다.
+        조회 모드에서는 저장소의 색인으로 표에 보일 만큼만 읽는다.
+        """
+        # 정렬 기준을 바꾼 경우 첫 페이지부터 다시 표시
+        if e is not None:
+            self.row_limit = ROW_PAGE_SIZE
         
-        if self.show_past_events:
+        today = self.progress_engine.today().toordinal()
+        index = self.event_index
+        
+        if self.query_store is not None:
+            self.visible_events = self.query_visible_events(today)
+        elif self.show_past_events:
             # 지나간 일정 정렬 옵션
             sort_key = self.past_sort_dropdown.value
             
-            if sort_key == "날짜순":
+            if sort_key == "이름순":
+                self.visible_events = index.past_by_name(today)
+            else:
                 # 날짜순 정렬 (최근 날짜가 위로)
-                def get_date(event):
-                    try:
-                        date_str = event.get('date', '')
-                        return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    except ValueError:
-                        # 날짜 형식이 잘못된 경우 가장 오래된 날짜로 정렬
-                        return datetime.date(1900, 1, 1)
-                        
-                self.events.sort(key=get_date, reverse=True)
-            elif sort_key == "이름순":
-                self.events.sort(key=lambda x: x.get('name', '').lower())
+                self.visible_events = index.past(today)
         else:
-            # 현재 일정 정렬 옵션
+            # 현재 일정 정렬 옵션 (날짜 형식 오류 일정은 하단에 표시)
             sort_key = self.sort_dropdown.value
             
-            if sort_key == "급한 순서":
-                def get_days_diff(event):
-                    try:
-                        date_str = event.get('date', '')
-                        event_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                        # 과거 일정은 하단에 정렬
-                        if event_date < today:
-                            return float('inf')
-                        return (event_date - today).days
-                    except ValueError:
-                        # 날짜 형식이 잘못된 경우 최하위로 정렬
-                        return float('inf')
-                        
-                self.events.sort(key=get_days_diff)
-            elif sort_key == "이름순":
-                # 현재 일정만 정렬
-                current_events = [e for e in self.events if try_parse_date(e.get('date', '')) >= today]
-                past_events = [e for e in self.events if try_parse_date(e.get('date', '')) < today]
-                
-                current_events.sort(key=lambda x: x.get('name', '').lower())
-                past_events.sort(key=lambda x: x.get('name', '').lower())
-                
-                self.events = current_events + past_events
+            if sort_key == "이름순":
+                self.visible_events = index.upcoming_by_name(today) + index.invalid_by_name()
+            else:
+                # 급한 순서 (가까운 날짜가 위로)
+                self.visible_events = index.upcoming(today) + index.invalid()
 
         # 테이블 데이터 갱신
         self.populate_table()
-        self.page.update()
+        self.updates.request(self.events_table, self.load_more_btn, self.edit_button, self.delete_button)
 
     # --- 유틸리티 메서드 ---
-    def show_snackbar(self, message, color=ft.Colors.GREEN):
-        """스낵바 메시지 표시"""
+    def show_snackbar(self, message, color=None):
+        """스낵바 메시지 표시 (기본 색: 초록)"""
+        if color is None:
+            color = ft.Colors.GREEN
         self.page.snack_bar = ft.SnackBar(
             content=ft.Text(message),
             bgcolor=color
         )
         self.page.snack_bar.open = True
-        self.page.update()
+        # 스낵바는 페이지 속성이므로 페이지 전체 갱신
+        self.updates.request()
 
     def show_date_picker(self, date_field):
         """DatePicker 표시 - 속성을 명시적으로 설정"""
+        if not date_picker_supported():
+            self.show_snackbar("이 버전의 flet 에서는 달력을 사용할 수 없습니다. 날짜를 직접 입력하세요", ft.Colors.RED)
+            return
+
         # 현재 날짜 필드 기억 
         self.current_date_field = date_field
-        print(f"현재 날짜 필드 설정: {date_field}, ID: {id(date_field)}")
+        mark("show_date_picker", field=id(date_field))
         
         # 날짜 선택 시 호출되는 함수
-        def handle_date_change(e):
-            print("================ 날짜 선택 이벤트 발생! ================")
-            print(f"현재 날짜 필드: {self.current_date_field}, ID: {id(self.current_date_field) if self.current_date_field else None}")
+        def apply_date_change(e):
+            mark("date_picker.change", data=getattr(e, 'data', None))
             
             try:
                 if hasattr(e, 'data') and e.data:
-                    print(f"이벤트 데이터: {e.data}")
-                    
                     if isinstance(e.data, str):
                         if 'T' in e.data:
                             formatted_date = e.data.split('T')[0]
@@ -867,22 +1045,17 @@ class DDayManager:
                         # 1. self.current_date_field 사용
                         if self.current_date_field is not None:
                             target_field = self.current_date_field
-                            print(f"현재 필드 참조 사용")
                         # 2. new_event_date_str 확인
                         elif self.new_date_row.visible:
                             target_field = self.new_date_row.controls[0]
-                            print(f"new_date_row 사용 (추가 폼)")
                         # 3. edit_event_date_str 확인
                         elif self.edit_date_row.visible:
                             target_field = self.edit_date_row.controls[0] 
-                            print(f"edit_date_row 사용 (수정 폼)")
                         
                         if target_field:
-                            print(f"타겟 필드: {target_field}, ID: {id(target_field)}")
                             target_field.value = formatted_date
                             target_field.error_text = None
-                            self.page.update()
-                            print(f"날짜 설정됨: {formatted_date}")
+                            self.updates.request(target_field)
                             self.show_snackbar(f"날짜가 설정되었습니다: {formatted_date}", ft.Colors.GREEN)
                         else:
                             print("사용할 날짜 필드를 찾을 수 없습니다")
@@ -893,13 +1066,16 @@ class DDayManager:
                 print(traceback.format_exc())
                 self.show_snackbar(f"날짜 처리 오류: {str(ex)}", ft.Colors.RED)
         
+        # 필드 갱신과 스낵바를 한 번에 전송
+        def handle_date_change(e):
+            with self.updates:
+                apply_date_change(e)
+        
         # 닫기 이벤트 처리 함수
         def handle_dismiss(e):
-            print("DatePicker 닫힘")
+            mark("date_picker.dismiss")
             
         try:
-            print("DatePicker 열기 시도")
-            
             # 클로저에서 현재 필드를 안전하게 유지하기 위한 참조 복사
             _current_field = date_field
             
@@ -916,12 +1092,11 @@ class DDayManager:
             # DatePicker에 필드 정보 저장
             if hasattr(date_picker, '_field_ref'):
                 date_picker._field_ref = _current_field
-                print(f"DatePicker에 필드 참조 저장: {id(_current_field)}")
             
             self.page.overlay.append(date_picker)
-            self.page.update()
+            self.updates.request()
             self.page.open(date_picker)
-            print("DatePicker가 열렸습니다")
+            mark("date_picker.open")
             
         except Exception as e:
             print(f"DatePicker 오류: {e}")
@@ -1006,6 +1181,7 @@ class DDayManager:
             )
         )
 
+    @batched
     def toggle_past_events(self, e):
         """현재 일정과 지나간 일정 간 전환"""
         self.show_past_events = not self.show_past_events
@@ -1027,87 +1203,57 @@ class DDayManager:
         self.edit_button.disabled = True
         self.delete_button.disabled = True
         
-        # 테이블 다시 채우기
+        # 테이블 다시 채우기 (첫 페이지부터)
+        self.row_limit = ROW_PAGE_SIZE
         self.sort_and_populate()
         
-        self.page.update()
+        self.updates.request(
+            self.toggle_past_events_btn, self.sort_dropdown, self.past_sort_dropdown,
+            self.page.floating_action_button
+        )
 
     def create_year_progress_ui(self):
-        """연간 진행률 UI 생성"""
-        # 오늘 날짜 가져오기
-        today = datetime.date.today()
-        
+        """연간 진행률 UI 생성 (한 번만 만들고 이후에는 값만 갱신)"""
         # 제목 텍스트
-        title_text = ft.Text(
-            f"오늘은 {today.year}년 {today.month}월 {today.day}일 입니다",
+        self.year_title_text = ft.Text(
             size=28,
             weight=ft.FontWeight.BOLD,
             color=ft.Colors.WHITE
         )
         
-        # 연간 진행률 계산
-        current_year = today.year
-        total_days = 366 if calendar.isleap(current_year) else 365
-        
-        year_end = datetime.date(current_year, 12, 31)
-        days_remaining = (year_end - today).days
-        days_passed = total_days - days_remaining
-        progress = (days_passed / total_days) * 100
-        
         # 진행률 텍스트
-        year_label = ft.Text(
-            f"당신의 {current_year}년은",
+        self.year_label = ft.Text(
             size=24,
             color=ft.Colors.WHITE
         )
         
-        progress_label = ft.Text(
-            f"{progress:.1f}% 없어졌습니다",
+        self.year_progress_label = ft.Text(
             size=36,
             weight=ft.FontWeight.BOLD,
             color=ft.Colors.RED
         )
         
-        days_label = ft.Text(
-            f"{days_passed}/{total_days}일",
+        self.year_days_label = ft.Text(
             size=22,
             color=ft.Colors.WHITE
         )
         
-        # 남은 일수 레이블
-        remaining_label = ft.Text(
-            f"{days_remaining}일 남음",
+        # 남은 일수 레이블 (가장 가까운 D-Day가 있으면 그 일정까지 남은 일수)
+        self.year_remaining_label = ft.Text(
             size=22,
             color=ft.Colors.BLUE
         )
         
-        # 가장 가까운 D-Day 찾기
-        closest_dday = None
-        closest_days_left = float('inf')
-        
-        for event in self.events:
-            try:
-                event_date = datetime.datetime.strptime(event.get('date', ''), "%Y-%m-%d").date()
-                days_left = (event_date - today).days
-                if days_left >= 0 and days_left < closest_days_left:
-                    closest_days_left = days_left
-                    closest_dday = event
-            except ValueError:
-                continue
-        
-        # 가장 가까운 D-Day가 있으면 표시
-        if closest_dday:
-            remaining_label.value = f"{closest_dday.get('name', '')}까지 {closest_days_left}일 남음"
-        
-        # 프로그레스 바
-        progress_bar = ft.ProgressBar(
-            width=650,
-            height=30,
-            value=progress/100,
-            color=ft.Colors.RED_400,
-            bgcolor=ft.Colors.GREY_300
+        # 프로그레스 바 (tkinter 앱과 같은 그라데이션 PNG, 0.1% 단위로 캐시됨)
+        self.year_progress_bar = ft.Image(
+            width=PROGRESS_BAR_WIDTH,
+            height=PROGRESS_BAR_HEIGHT,
+            fit=ft.ImageFit.FILL
         )
         
+        # 처음 값 채우기
+        self.refresh_year_progress()
+        
         # 닫기 버튼
         close_button = ft.ElevatedButton(
             text="돌아가기",
@@ -1123,15 +1269,15 @@ class DDayManager:
         return ft.Container(
             content=ft.Column(
                 [
-                    title_text,
+                    self.year_title_text,
                     ft.Container(height=20),
-                    year_label,
-                    progress_label,
+                    self.year_label,
+                    self.year_progress_label,
                     ft.Container(height=20),
-                    progress_bar,
+                    self.year_progress_bar,
                     ft.Container(height=20),
-                    days_label,
-                    remaining_label,
+                    self.year_days_label,
+                    self.year_remaining_label,
                     ft.Container(height=30),
                     close_button
                 ],
@@ -1148,18 +1294,52 @@ class DDayManager:
             alignment=ft.alignment.center
         )
     
+    def refresh_year_progress(self):
+        """연간 진행률 컨트롤의 값을 오늘 기준으로 바꾸고 실제로 바뀐 컨트롤 목록 반환"""
+        now = self.progress_engine.now()
+        today = now.date()
+        today_ordinal = today.toordinal()
+        days_passed, days_remaining, total_days = self.progress_engine.days(now)
+        # 진행률은 마이크로초 단위까지 반영 (실시간 갱신 시 값이 계속 바뀜)
+        progress = self.progress_engine.progress(now)
+        
+        remaining = f"{days_remaining}일 남음"
+        closest_dday = self.closest_upcoming(today_ordinal)
+        if closest_dday:
+            remaining = f"{closest_dday.name}까지 {closest_dday.days_left(today_ordinal)}일 남음"
+        
+        changed = []
+        for control, value in (
+            (self.year_title_text, f"오늘은 {today.year}년 {today.month}월 {today.day}일 입니다"),
+            (self.year_label, f"당신의 {today.year}년은"),
+            (self.year_progress_label, f"{progress:.{PROGRESS_DECIMALS}f}% 없어졌습니다"),
+            (self.year_days_label, f"{days_passed}/{total_days}일"),
+            (self.year_remaining_label, remaining),
+        ):
+            if control.value != value:
+                control.value = value
+                changed.append(control)
+        
+        # 0.1% 구간이 바뀐 경우에만 막대 이미지 교체
+        bar = gradient_png_base64(PROGRESS_BAR_WIDTH, PROGRESS_BAR_HEIGHT, progress_bucket(progress))
+        if self.year_progress_bar.src_base64 != bar:
+            self.year_progress_bar.src_base64 = bar
+            changed.append(self.year_progress_bar)
+        return changed
+    
+    @batched
     def toggle_year_progress(self, e=None):
-        """연간 진행률 화면 전환"""
+        """연간 진행률 화면 전환
+
+        두 화면 모두 미리 만들어 두었으므로 표시 여부와 버튼 상태만 바꾼다.
+        """
         # 화면 상태 변경
         self.show_year_progress = not self.show_year_progress
         
         # 메인 컨텐츠와 연간 진행률 화면 전환
-        self.events_table.visible = not self.show_year_progress
+        self.schedule_view.visible = not self.show_year_progress
         self.add_form.visible = False
         self.edit_form.visible = False
-        
-        for row in self.page.controls[0].controls[1].controls:
-            row.visible = not self.show_year_progress
             
         # 버튼 상태 변경
         if self.show_year_progress:
@@ -1171,9 +1351,11 @@ class DDayManager:
             self.delete_button.visible = False
             self.page.floating_action_button.visible = False
             
-            # 연간 진행률 표시 업데이트
-            self.update_year_progress()
+            # 연간 진행률 값 갱신 (아래에서 컨테이너와 함께 전송) 후 실시간 갱신 시작
+            self.refresh_year_progress()
+            self.start_progress_ticker()
         else:
+            self.stop_progress_ticker()
             self.year_progress_btn.text = "올해 진행률 보기"
             self.toggle_past_events_btn.visible = True
             self.sort_dropdown.visible = not self.show_past_events
@@ -1185,34 +1367,58 @@ class DDayManager:
         # 연간 진행률 컨테이너 표시/숨김
         self.year_progress_container.visible = self.show_year_progress
         
-        self.page.update()
+        self.updates.request(
+            self.year_progress_btn, self.toggle_past_events_btn, self.sort_dropdown,
+            self.past_sort_dropdown, self.edit_button, self.delete_button,
+            self.page.floating_action_button, self.schedule_view, self.year_progress_container
+        )
     
     def update_year_progress(self):
-        """연간 진행률 정보 업데이트"""
+        """연간 진행률 정보 업데이트 (바뀐 텍스트와 막대만 전송)"""
         if not self.show_year_progress:
             return
-            
-        # 새로운 연간 진행률 UI로 교체
-        new_progress_container = self.create_year_progress_ui()
-        new_progress_container.visible = True
-        
-        # 기존 컨테이너를 새 것으로 교체
-        container_index = self.page.controls[0].controls.index(self.year_progress_container)
-        self.page.controls[0].controls[container_index] = new_progress_container
-        self.year_progress_container = new_progress_container
-        
-        self.page.update()
+        changed = self.refresh_year_progress()
+        if changed:
+            self.updates.request(*changed)
 
+    def start_progress_ticker(self):
+        """연간 진행률 실시간 갱신 작업 시작 (flet 이벤트 루프에서 실행)"""
+        if self.progress_ticker is None:
+            self.progress_ticker = self.page.run_task(self.tick_year_progress)
 
-def try_parse_date(date_str):
-    """날짜 문자열을 파싱하여 date 객체로 반환, 실패시 최소 날짜 반환"""
-    try:
-        return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError:
-        return datetime.date(1900, 1, 1)  # 최소 날짜 반환
+    def stop_progress_ticker(self):
+        """연간 진행률 실시간 갱신 작업 중지"""
+        if self.progress_ticker is not None:
+            self.progress_ticker.cancel()
+            self.progress_ticker = None
+
+    async def tick_year_progress(self):
+        """진행률 화면이 보이는 동안 표시 값이 바뀌는 시각마다 값을 다시 계산
 
-def main(page: ft.Page):
+        진행률(소수 PROGRESS_DECIMALS 자리)이나 날짜가 바뀌는 시각까지 기다리되
+        최대 PROGRESS_TICK 초마다는 깨어나고, 실제로 바뀐 컨트롤만 전송한다.
+        """
+        engine = self.progress_engine
+        while self.show_year_progress:
+            now = engine.now()
+            delay = (engine.next_change(PROGRESS_DECIMALS, now) - now).total_seconds() + PROGRESS_TICK_MARGIN
+            await asyncio.sleep(min(max(delay, 0), PROGRESS_TICK))
+            try:
+                self.update_year_progress()
+            except Exception as e:
+                print(f"Error updating year progress: {e}")
+                return
+
+
+def main(page):
     """앱 메인 함수"""
+    if DIAGNOSTICS:
+        print(f"Flet version: {get_flet_version()}")
+
+    # tkinter 앱의 예전 d-day.csv 가 있으면 공용 파일로 한 번 합침
+    if DATA_FILE == DEFAULT_DATA_FILE:
+        merge_legacy_csv(DATA_FILE)
+
     # 페이지 기본 설정 - 최소한의 필수 설정만 유지
     page.title = "D-Day 관리"
     page.theme_mode = ft.ThemeMode.LIGHT
@@ -1223,5 +1429,6 @@ def main(page: ft.Page):
     app = DDayManager(page)
 
 
-# 애플리케이션 실행 - 기본 설정으로만 실행
-ft.app(target=main) 
\ No newline at end of file
+if __name__ == "__main__":
+    # 애플리케이션 실행 - 기본 설정으로만 실행
+    ft.app(target=main) 
\ No newline at end of file
@@ -4,11 +4,31 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from datetime import datetime, date, timedelta
-import calendar
+from datetime import date
 import os
 import locale
 
+from dday_core.event import Event
+from dday_core.gradient import gradient_tk_row, progress_bucket
+from dday_core.progress import ProgressEngine, should_blink
+from dday_core.storage import DEFAULT_DATA_FILE, merge_legacy_csv, open_store
+from dday_core.tracing import traced
+from dday_core.weeks import FUTURE, PAST, SEPARATOR_SLOT, SLOTS, TARGET, TODAY, week_state_matrix
+
+# D-Day 목록 파일 (지정하지 않으면 flet 앱과 같은 기본 파일을 함께 사용)
+DATA_FILE = os.environ.get('DDAY_DATA_FILE', DEFAULT_DATA_FILE)
+
+# 연간 진행률 계산 시간대 (예: Asia/Seoul, 지정하지 않으면 로컬 시간)
+TIMEZONE = os.environ.get('DDAY_TIMEZONE') or None
+
+# 진행률 표시 소수점 자릿수 (진행률 바도 0.1% 단위로 다시 그림)
+PROGRESS_DECIMALS = 1
+
+# 표시 값이 바뀌는 시각(자정 등) 직후 값이 확실히 바뀐 뒤에 깨어나도록 두는 여유 시간
+MIDNIGHT_MARGIN_MS = 50
+# 절전 복귀나 시계 변경에 대비한 최대 갱신 간격 (10분)
+MAX_UPDATE_INTERVAL_MS = 10 * 60 * 1000
+
 # Locale setup (Korean)
 try:
     locale.setlocale(locale.LC_ALL, 'ko_KR.UTF-8')  # Linux/Mac
@@ -29,11 +49,11 @@ class AddDDayDialog(tk.Toplevel):
             self.title("D-Day 수정")
             self.edit_mode = True
             self.edit_index = edit_data[0]
-            name, date_obj = edit_data[1]
+            name, date_obj = edit_data[1].name, edit_data[1].date_obj
         else:  # 추가 모드
             self.title("D-Day 추가")
             self.edit_mode = False
-            name, date_obj = "", date.today()
+            name, date_obj = "", parent.today
 
         self.geometry("300x200")
         self.resizable(False, False)
@@ -86,7 +106,7 @@ class AddDDayDialog(tk.Toplevel):
 
 
 class DDayManager(tk.Toplevel):
-    def __init__(self, parent, ddays=None):
+    def __init__(self, parent, ddays=None, progress_engine=None):
         super().__init__(parent)
         self.parent = parent
         self.title("D-Day 관리자")
@@ -94,7 +114,9 @@ class DDayManager(tk.Toplevel):
         self.protocol("WM_DELETE_WINDOW", self.on_close)  # 창 닫기 이벤트 처리
         
         self.ddays = ddays if ddays is not None else []
-        self.today = date.today()
+        # 오늘 날짜는 메인 창과 같은 시간대(DDAY_TIMEZONE) 기준
+        self.progress_engine = progress_engine if progress_engine is not None else ProgressEngine(TIMEZONE)
+        self.today = self.progress_engine.today()
         
         # 상단 프레임 (버튼 영역)
         self.button_frame = ttk.Frame(self)
@@ -132,6 +154,13 @@ class DDayManager(tk.Toplevel):
             font=('Malgun Gothic', 14, 'bold')
         )
         self.date_label.pack(pady=10)
+
+        # 일정 id → 행 위젯 / 마지막으로 반영한 (텍스트, 주 상태) / 배치 순서
+        self.position_label = None
+        self.no_dday_label = None
+        self.dday_rows = {}
+        self.dday_row_states = {}
+        self.dday_row_order = []
         
         # D-Day 목록 표시
         self.update_dday_list()
@@ -146,8 +175,8 @@ class DDayManager(tk.Toplevel):
         dialog = AddDDayDialog(self)
         self.wait_window(dialog)
         if dialog.result:
-            self.ddays.append(dialog.result)
-            self.ddays.sort(key=lambda x: x[1])  # 날짜 순으로 정렬
+            self.ddays.append(Event(*dialog.result))
+            self.ddays.sort(key=lambda x: x.ordinal)  # 날짜 순으로 정렬
             self.update_dday_list()
     
     def edit_dday(self):
@@ -156,14 +185,15 @@ class DDayManager(tk.Toplevel):
             dialog = AddDDayDialog(self, edit_data=selection)
             self.wait_window(dialog)
             if dialog.result:
-                self.ddays[selection[0]] = dialog.result
-                self.ddays.sort(key=lambda x: x[1])  # 날짜 순으로 정렬
+                event = self.ddays[selection[0]]
+                event.name, event.date = dialog.result
+                self.ddays.sort(key=lambda x: x.ordinal)  # 날짜 순으로 정렬
                 self.update_dday_list()
     
     def delete_dday(self):
         selection = self.get_selected_dday()
         if selection is not None:
-            name = selection[1][0]
+            name = selection[1].name
             result = messagebox.askyesno("확인", f"{name} D-Day를 삭제하시겠습니까?")
             if result:
                 del self.ddays[selection[0]]
@@ -176,8 +206,8 @@ class DDayManager(tk.Toplevel):
             messagebox.showinfo("알림", "등록된 D-Day가 없습니다.")
             return None
         
-        options = [f"{idx+1}. {name} ({date_obj.strftime('%Y-%m-%d')})" 
-                  for idx, (name, date_obj) in enumerate(self.ddays)]
+        options = [f"{idx+1}. {event.name} ({event.date})" 
+                  for idx, event in enumerate(self.ddays)]
         
         dialog = SelectDialog(self, "D-Day 선택", "수정/삭제할 D-Day를 선택하세요:", options)
         self.wait_window(dialog)
@@ -186,131 +216,154 @@ class DDayManager(tk.Toplevel):
             return (dialog.result, self.ddays[dialog.result])
         return None
     
+    @traced("update_dday_list")
     def update_dday_list(self):
-        # 기존 위젯 삭제
-        for widget in self.scrollable_frame.winfo_children():
-            if widget != self.date_label:  # 날짜 레이블은 유지
-                widget.destroy()
-        
+        """D-Day 목록 갱신
+
+        일정 id 별로 만든 행 위젯을 재사용하여 글자와 색만 바꾸고,
+        새로 추가되거나 삭제된 일정의 행만 만들거나 없앤다.
+        """
         # 현재 날짜 표시 업데이트
         self.date_label.config(text=f"오늘은 {self.today.year}년 {self.today.month}월 {self.today.day}일")
-        
-        # 현재 위치 표시 레이블
-        position_label = ttk.Label(
-            self.scrollable_frame,
-            text="당신의 위치 ▼",
-            font=('Malgun Gothic', 12),
-            anchor='e'
-        )
-        position_label.pack(fill=tk.X, padx=10, pady=5)
-        
-        # D-Day가 없는 경우 메시지 표시
-        if not self.ddays:
-            no_dday_label = ttk.Label(
+
+        # 현재 위치 표시 레이블 / 빈 목록 안내 레이블 (한 번만 생성)
+        if self.position_label is None:
+            self.position_label = ttk.Label(
+                self.scrollable_frame,
+                text="당신의 위치 ▼",
+                font=('Malgun Gothic', 12),
+                anchor='e'
+            )
+            self.position_label.pack(fill=tk.X, padx=10, pady=5)
+            self.no_dday_label = ttk.Label(
                 self.scrollable_frame,
                 text="등록된 D-Day가 없습니다. '추가' 버튼을 눌러 D-Day를 등록하세요.",
                 font=('Malgun Gothic', 12)
             )
-            no_dday_label.pack(pady=20)
+
+        # D-Day 목록 (날짜 오름차순 정렬)
+        sorted_ddays = sorted(self.ddays, key=lambda x: x.ordinal)
+
+        # 삭제된 일정의 행 제거
+        live_ids = {event.id for event in sorted_ddays}
+        for event_id in [event_id for event_id in self.dday_rows if event_id not in live_ids]:
+            self.dday_rows.pop(event_id)['frame'].destroy()
+            self.dday_row_states.pop(event_id, None)
+
+        # D-Day가 없는 경우 메시지 표시
+        if not sorted_ddays:
+            self.no_dday_label.pack(pady=20)
+            self.dday_row_order = []
             return
-        
-        # D-Day 목록 표시 (날짜 오름차순 정렬)
-        sorted_ddays = sorted(self.ddays, key=lambda x: x[1])
-        
-        for idx, (name, date_obj) in enumerate(sorted_ddays):
-            # D-Day 프레임 생성
-            dday_frame = ttk.Frame(self.scrollable_frame)
-            dday_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # 남은 날짜 계산
-            time_diff = date_obj - self.today
-            days_left = time_diff.days
-            
-            # D-Day 텍스트 생성
-            if days_left >= 0:
-                dday_text = f"D-{days_left}"
-            else:
-                dday_text = f"D+{abs(days_left)}"
-            
-            # D-Day 이름 및 날짜 표시
-            name_label = ttk.Label(
-                dday_frame,
-                text=f"{name} ({dday_text}): {date_obj.strftime('%Y-%m-%d')}",
-                font=('Malgun Gothic', 11)
-            )
-            name_label.pack(anchor='w')
-            
-            # 프로그레스 바 프레임
-            progress_frame = ttk.Frame(dday_frame)
-            progress_frame.pack(fill=tk.X, pady=5)
-            
-            # 8주 기간 (앞뒤 4주) 프로그레스 바 생성
-            self.create_weekly_progress_bar(progress_frame, date_obj)
-    
-    def create_weekly_progress_bar(self, parent_frame, target_date):
-        # 오늘 날짜 기준 앞뒤 4주 계산
-        start_date = self.today - timedelta(weeks=4)
-        end_date = self.today + timedelta(weeks=4)
-        
-        # 타겟 날짜가 8주 범위를 벗어나는 경우 조정
-        if target_date < start_date:
-            # 타겟 날짜가 시작일보다 이전인 경우 (이미 지난 D-Day)
-            weeks_diff = (start_date - target_date).days // 7
-            if weeks_diff > 0:
-                start_date = target_date
-                end_date = target_date + timedelta(weeks=8)
-        elif target_date > end_date:
-            # 타겟 날짜가 종료일보다 이후인 경우 (먼 미래의 D-Day)
-            weeks_diff = (target_date - end_date).days // 7
-            if weeks_diff > 0:
-                end_date = target_date
-                start_date = target_date - timedelta(weeks=8)
-        
-        # 주차별 프레임 생성
-        for week in range(9):  # 8주 + 구분선
-            current_date = start_date + timedelta(weeks=week)
-            
-            # 주차 프레임
-            week_frame = ttk.Frame(parent_frame)
-            week_frame.pack(side=tk.LEFT, fill=tk.Y)
-            
-            # 현재 주가 타겟 날짜를 포함하는지 확인
-            contains_target = False
-            for day in range(7):
-                day_date = current_date + timedelta(days=day)
-                if day_date == target_date:
-                    contains_target = True
-                    break
-            
-            # 현재 주가 오늘 날짜를 포함하는지 확인
-            contains_today = False
+        self.no_dday_label.pack_forget()
+
+        # 모든 일정의 주간 상태를 한 번에 계산
+        state_matrix = week_state_matrix([event.ordinal for event in sorted_ddays], self.today.toordinal())
+
+        for event, states in zip(sorted_ddays, state_matrix):
+            row = self.dday_rows.get(event.id)
+            if row is None:
+                row = self.create_dday_row()
+                self.dday_rows[event.id] = row
+            self.render_dday_row(event, row, states)
+
+        # 순서가 바뀐 경우에만 다시 배치
+        order = [event.id for event in sorted_ddays]
+        if order != self.dday_row_order:
+            for event_id in self.dday_row_order:
+                if event_id in self.dday_rows:
+                    self.dday_rows[event_id]['frame'].pack_forget()
+            for event_id in order:
+                self.dday_rows[event_id]['frame'].pack(fill=tk.X, padx=10, pady=5)
+            self.dday_row_order = order
+
+    def create_dday_row(self):
+        """D-Day 한 줄 위젯 생성 (이름 레이블 + 주간 진행 바)"""
+        dday_frame = ttk.Frame(self.scrollable_frame)
+
+        # D-Day 이름 및 날짜 표시
+        name_label = ttk.Label(dday_frame, font=('Malgun Gothic', 11))
+        name_label.pack(anchor='w')
+
+        # 프로그레스 바 프레임
+        progress_frame = ttk.Frame(dday_frame)
+        progress_frame.pack(fill=tk.X, pady=5)
+
+        # 8주 기간 (앞뒤 4주) 주간 진행 바
+        weekly_bar = WeeklyBar(progress_frame)
+        weekly_bar.pack(side=tk.LEFT)
+
+        return {
+            'frame': dday_frame,
+            'name_label': name_label,
+            'weekly_bar': weekly_bar,
+        }
+
+    def render_dday_row(self, event, row, states):
+        """행 위젯에 일정 내용을 반영 (바뀐 값만 설정)"""
+        name, date_obj = event.name, event.date_obj
+
+        # 남은 날짜 계산
+        days_left = (date_obj - self.today).days
+
+        # D-Day 텍스트 생성
+        if days_left >= 0:
+            dday_text = f"D-{days_left}"
+        else:
+            dday_text = f"D+{abs(days_left)}"
+
+        text = f"{name} ({dday_text}): {date_obj.strftime('%Y-%m-%d')}"
+
+        old_text, old_states = self.dday_row_states.get(event.id, (None, None))
+        if text != old_text:
+            row['name_label'].config(text=text)
+        if states != old_states:
+            row['weekly_bar'].set_states(states)
+        self.dday_row_states[event.id] = (text, states)
+
+
+class WeeklyBar(tk.Canvas):
+    """D-Day 한 줄의 8주 주간 진행 바
+
+    주마다 작은 사각형 7개(하루에 하나)를 그리고 가운데에 구분선을 둔다.
+    주별 사각형은 같은 태그로 묶어 색을 한 번에 바꾼다.
+    """
+
+    SQUARE = 10  # 하루 사각형 크기(px)
+    GAP = 2  # 사각형 사이 간격
+    WEEK_PAD = 2  # 주 좌우 여백
+    WEEK_COLORS = {FUTURE: 'black', PAST: 'gray', TODAY: 'blue', TARGET: 'red'}
+
+    def __init__(self, parent, **kwargs):
+        week_width = 7 * self.SQUARE + 6 * self.GAP
+        width = (SLOTS - 1) * (week_width + 2 * self.WEEK_PAD) + 2 + 2 * self.WEEK_PAD
+        height = self.SQUARE + 4
+        super().__init__(parent, width=width, height=height, highlightthickness=0, bd=0, **kwargs)
+
+        x = 0
+        week = 0
+        for slot in range(SLOTS):
+            if slot == SEPARATOR_SLOT:
+                # 중앙 구분선
+                x += self.WEEK_PAD
+                self.create_line(x + 1, 0, x + 1, height, fill='gray')
+                x += 2 + self.WEEK_PAD
+                continue
+            x += self.WEEK_PAD
             for day in range(7):
-                day_date = current_date + timedelta(days=day)
-                if day_date == self.today:
-                    contains_today = True
-                    break
-            
-            # 주차 블록 생성
-            if week == 4:  # 중앙 구분선
-                separator = ttk.Separator(week_frame, orient='vertical')
-                separator.pack(fill=tk.Y, padx=2, pady=2)
-            else:
-                # 주차 표시 (■ 사용)
-                week_block = ttk.Label(
-                    week_frame, 
-                    text="■■■■■■■",
-                    font=('Malgun Gothic', 10)
-                )
-                
-                # 색상 설정
-                if contains_target:
-                    week_block.config(foreground='red')  # 타겟 날짜 포함 주는 빨간색
-                elif contains_today:
-                    week_block.config(foreground='blue')  # 오늘 날짜 포함 주는 파란색
-                elif current_date <= self.today:
-                    week_block.config(foreground='gray')  # 지난 주는 회색
-                
-                week_block.pack(padx=2)
+                left = x + day * (self.SQUARE + self.GAP)
+                self.create_rectangle(left, 2, left + self.SQUARE, 2 + self.SQUARE,
+                                      width=0, fill='black', tags=(f"week{week}",))
+            x += week_width + self.WEEK_PAD
+            week += 1
+        self._states = (FUTURE,) * (SLOTS - 1)
+
+    def set_states(self, states):
+        """주 상태(dday_core.weeks) 8개를 반영, 바뀐 주만 색을 바꿈"""
+        for week, (old, new) in enumerate(zip(self._states, states)):
+            if old != new:
+                self.itemconfig(f"week{week}", fill=self.WEEK_COLORS[new])
+        self._states = states
 
 
 class SelectDialog(tk.Toplevel):
@@ -375,6 +428,51 @@ class SelectDialog(tk.Toplevel):
         self.destroy()
 
 
+class GradientBar(tk.Canvas):
+    """연간 진행률 그라데이션 바
+
+    1px 프레임 수백 개 대신 캔버스 하나에 PhotoImage 한 장을 올리고,
+    한 줄짜리 색 목록(dday_core.gradient)을 높이만큼 타일링해 한 번의 put 으로
+    그린다. 진행률이 0.1% 단위로 바뀔 때만 다시 그린다.
+    """
+
+    def __init__(self, parent, width=600, height=40, **kwargs):
+        super().__init__(parent, width=width, height=height, bg='white',
+                         highlightthickness=0, bd=0, **kwargs)
+        self.bar_height = height
+        self.bar_width = 0
+        self.image = None
+        self.progress = 0.0
+        self._drawn = None
+        self.resize(width)
+
+    def resize(self, width):
+        """바 폭 변경 (이미지를 새로 만들고 다시 그림)"""
+        width = max(1, int(width))
+        if width == self.bar_width:
+            return
+        self.bar_width = width
+        self.config(width=width)
+        self.image = tk.PhotoImage(width=width, height=self.bar_height)
+        self.delete('all')
+        self.create_image(0, 0, image=self.image, anchor='nw')
+        self._drawn = None
+        self.draw(self.progress)
+
+    def draw(self, progress):
+        """진행률(%)에 맞게 바를 그림, 그릴 필요가 없으면 False"""
+        self.progress = progress
+        bucket = progress_bucket(progress)
+        if bucket == self._drawn:
+            return False
+
+        # 한 줄을 (0, 0)-(width, height) 영역에 타일링
+        self.image.put(gradient_tk_row(self.bar_width, bucket),
+                       to=(0, 0, self.bar_width, self.bar_height))
+        self._drawn = bucket
+        return True
+
+
 class YearProgressApp:
     def __init__(self, root):
         self.root = root
@@ -443,15 +541,8 @@ class YearProgressApp:
         )
         self.progress_label.pack()
 
-        self.progress_frame = tk.Frame(root, bg='white', height=40, width=600)
-        self.progress_frame.pack(pady=25)
-        self.progress_frame.pack_propagate(False)
-
-        self.gradient_frames = []
-        for i in range(600):
-            frame = tk.Frame(self.progress_frame, height=40, width=1)
-            frame.pack(side=tk.LEFT)
-            self.gradient_frames.append(frame)
+        self.progress_bar = GradientBar(root, width=600, height=40)
+        self.progress_bar.pack(pady=25)
 
         self.days_label = tk.Label(
             root,
@@ -487,12 +578,20 @@ class YearProgressApp:
         self.dday_manager_button.pack()
 
         self.ddays = []  # D-Day 목록
+        self.hidden_ddays = []  # 날짜 형식이 잘못되어 표시하지 않는 일정 (저장 시 유지)
+        # 예전 버전이 쓰던 d-day.csv 가 있으면 공용 파일로 한 번 합침
+        if DATA_FILE == DEFAULT_DATA_FILE:
+            merge_legacy_csv(DATA_FILE)
+        self.store = open_store(DATA_FILE)
         self.is_blinking = False
+        self.progress_engine = ProgressEngine(TIMEZONE)  # 올해 시작/끝 시각을 캐시하는 진행률 계산기
+        self._update_after_id = None  # 예약된 update_progress
+        self._blink_after_id = None  # 예약된 blink_remaining_label
         self.load_ddays()  # D-Day 목록 불러오기
         self.update_progress()
 
     def open_dday_manager(self):
-        manager = DDayManager(self.root, self.ddays)
+        manager = DDayManager(self.root, self.ddays, self.progress_engine)
         self.root.wait_window(manager)  # 관리자 창이 닫힐 때까지 기다림
         
         # D-Day 목록 업데이트 (창이 닫힌 후)
@@ -508,51 +607,54 @@ class YearProgressApp:
         self.update_progress()
 
     def load_ddays(self):
-        self.ddays = []
-        if not os.path.exists("d-day.csv"):  # 파일 없으면 생성
-            with open("d-day.csv", "w") as f:
-                pass
-
         try:
-            with open("d-day.csv", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:  # 빈 줄 무시
-                        parts = line.split(",")
-                        if len(parts) >= 4:  # 유효한 포맷 확인
-                            name, year, month, day = parts[0], parts[1], parts[2], parts[3]
-                            try:
-                                self.ddays.append((name, date(int(year), int(month), int(day))))
-                            except ValueError:
-                                # 잘못된 날짜 형식은 무시
-                                pass
-        except FileNotFoundError:
-            pass  # 파일이 없으면 그냥 빈 리스트
+            events = self.store.load()
         except Exception as e:
-            messagebox.showerror("오류", f"d-day.csv 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
+            messagebox.showerror("오류", f"{DATA_FILE} 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
             self.ddays = []
+            self.hidden_ddays = []
+            return
+
+        self.ddays = [event for event in events if event.ordinal is not None]
+        self.hidden_ddays = [event for event in events if event.ordinal is None]
+
+        # 읽지 못한 줄 알림
+        errors = self.store.errors
+        if errors:
+            details = "\n".join(f"{line_number}번째 줄: {reason}" for line_number, reason in errors[:5])
+            if len(errors) > 5:
+                details += f"\n... 외 {len(errors) - 5}개"
+            messagebox.showwarning("알림", f"{DATA_FILE} 파일에서 {len(errors)}개 줄을 읽지 못했습니다.\n{details}")
 
     def save_ddays(self):
-        try:
-            with open("d-day.csv", "w") as f:
-                for name, date_obj in self.ddays:
-                    f.write(f"{name},{date_obj.year},{date_obj.month},{date_obj.day}\n")
-        except Exception as e:
-            messagebox.showerror("오류", f"d-day.csv 파일을 저장하는 중 오류가 발생했습니다: {str(e)}")
+        # 마지막으로 읽거나 저장한 뒤 바뀐 일정만 기록 (바뀐 것이 없으면 쓰지 않음)
+        if not self.store.sync(self.ddays + self.hidden_ddays):
+            messagebox.showerror("오류", f"{DATA_FILE} 파일을 저장하는 중 오류가 발생했습니다")
 
     def calculate_progress(self):
-        current_date = datetime.now()
-        current_year = current_date.year
-        total_days = 366 if calendar.isleap(current_year) else 365
+        current_date = self.progress_engine.now()
+        progress = self.progress_engine.progress(current_date)
+        days_passed, days_remaining, total_days = self.progress_engine.days(current_date)
+        return current_date, progress, days_passed, days_remaining, total_days
 
-        year_end = date(current_year, 12, 31)
-        days_remaining = (year_end - current_date.date()).days
-        days_passed = total_days - days_remaining
-        progress = (days_passed / total_days) * 100
+    def next_update_delay(self, now):
+        """다음에 화면 값이 바뀌는 시점까지 남은 시간(ms)
 
-        return current_date, progress, days_passed, days_remaining, total_days
+        진행률(소수 PROGRESS_DECIMALS 자리)이 바뀌는 시각과 일수, 남은 날짜,
+        깜빡임 기준이 바뀌는 자정 중 빠른 쪽까지 기다린다. 절전이나 시계
+        변경에 대비해 최대 MAX_UPDATE_INTERVAL_MS 마다는 다시 확인한다.
+        """
+        next_change = self.progress_engine.next_change(PROGRESS_DECIMALS, now)
+        delay = int((next_change - now).total_seconds() * 1000) + MIDNIGHT_MARGIN_MS
+        return max(1, min(delay, MAX_UPDATE_INTERVAL_MS))
 
+    @traced("update_progress")
     def update_progress(self):
+        # 관리자 창 등에서 직접 호출된 경우 이미 예약된 갱신은 취소 (중복 루프 방지)
+        if self._update_after_id is not None:
+            self.root.after_cancel(self._update_after_id)
+            self._update_after_id = None
+
         current_date, progress, days_passed, days_remaining, total_days = self.calculate_progress()
 
         # 날짜 부분만 노란색으로 설정
@@ -560,66 +662,55 @@ class YearProgressApp:
         self.date_colored_label.config(text=date_colored)
         
         self.year_label.config(text=f"당신의 {current_date.year}년은")
-        self.progress_label.config(text=f"{progress:.1f}% 없어졌습니다")
-        self.days_label.config(text=f"{days_passed}/{total_days}일")
-        self.progress_label.config(text=f"{progress:.1f}% 없어졌습니다")
+        self.progress_label.config(text=f"{progress:.{PROGRESS_DECIMALS}f}% 없어졌습니다")
         self.days_label.config(text=f"{days_passed}/{total_days}일")
 
         # 가장 가까운 D-Day 찾기 (오늘 이후 날짜만)
         closest_dday = None
         closest_days_left = float('inf')  # 양의 무한대
 
-        today = date.today()
-        for name, date_obj in self.ddays:
-            days = (date_obj - today).days
+        today = current_date.toordinal()
+        for event in self.ddays:
+            days = event.ordinal - today
             if days >= 0 and days < closest_days_left:
                 closest_days_left = days
-                closest_dday = (name, date_obj)
+                closest_dday = event
 
         # 남은 날짜 및 깜빡임 효과
         if closest_dday:  # D-Day가 있으면
-            if closest_days_left < 10 and not self.is_blinking:
+            if should_blink(closest_days_left) and not self.is_blinking:
                 self.is_blinking = True
-                self.blink_remaining_label()
-            elif closest_days_left >= 10 and self.is_blinking:
+                if self._blink_after_id is None:
+                    self.blink_remaining_label()
+            elif not should_blink(closest_days_left) and self.is_blinking:
                 self.is_blinking = False
                 self.remaining_label.config(fg='#00BFFF')
 
-            self.remaining_label.config(text=f"{closest_dday[0]}까지 {closest_days_left}일 남음")
+            self.remaining_label.config(text=f"{closest_dday.name}까지 {closest_days_left}일 남음")
 
         else:  # D-Day 없으면
             self.remaining_label.config(text=f"{days_remaining}일 남음")  # 기본값 (연말 기준)
-            if days_remaining < 10 and not self.is_blinking:  # 연말 기준 깜빡임
+            if should_blink(days_remaining) and not self.is_blinking:  # 연말 기준 깜빡임
                 self.is_blinking = True
-                self.blink_remaining_label()
-            elif days_remaining >= 10 and self.is_blinking:
+                if self._blink_after_id is None:
+                    self.blink_remaining_label()
+            elif not should_blink(days_remaining) and self.is_blinking:
                 self.is_blinking = False
                 self.remaining_label.config(fg='#00BFFF')
 
-        # 진행률 바 그라데이션
-        for i in range(600):
-            if i / 600 < progress / 100:
-                if progress < 30:
-                    r = 255
-                    g = int((progress / 30) * 255)
-                    b = int((progress / 30) * 255)
-                else:
-                    r = int(0x4C + (0xAF - 0x4C) * (i / 600))
-                    g = int(0xAF + (0x50 - 0xAF) * (i / 600))
-                    b = int(0x50 + (0x50 - 0x50) * (i / 600))
-                hex_color = "#{:02x}{:02x}{:02x}".format(r, g, b)
-                self.gradient_frames[i].config(bg=hex_color)
-            else:
-                self.gradient_frames[i].config(bg='white')
-
-        self.root.after(1000, self.update_progress)
+        # 진행률 바 그라데이션 (채워진 폭이나 색이 바뀔 때만 다시 그림)
+        self.progress_bar.draw(progress)
+
+        self._update_after_id = self.root.after(
+            self.next_update_delay(self.progress_engine.now()), self.update_progress)
 
     def blink_remaining_label(self):
+        self._blink_after_id = None
         if self.is_blinking:
             current_color = self.remaining_label.cget('fg')
             new_color = 'black' if current_color == '#00BFFF' else '#00BFFF'
             self.remaining_label.config(fg=new_color)
-            self.root.after(500, self.blink_remaining_label)
+            self._blink_after_id = self.root.after(500, self.blink_remaining_label)
 
 
 if __name__ == "__main__":